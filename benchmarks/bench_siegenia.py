@@ -0,0 +1,428 @@
+"""Benchmarks for the Siegenia WebSocket client against the local simulator.
+
+Measures, against tools/siegenia_simulator.py:
+
+* request round-trip time (p50/p90/p99) of single requests
+* requests per second with N requests in flight
+* push latency from the socket to the data callback, and through
+  SiegeniaDataUpdateCoordinator._handle_data_update to a listening entity
+  when Home Assistant is installed
+* CPU time and memory per connected device at 1, 10, 100 and 500 devices
+
+Results are printed (or written with --output) as one JSON document so runs
+can be compared release over release.
+
+Example:
+    python benchmarks/bench_siegenia.py --output bench.json
+    python benchmarks/bench_siegenia.py --fleet-sizes 1 10 --requests 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import importlib
+import json
+import os
+import platform
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import types
+from typing import Any
+
+import aiohttp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_DIR = os.path.join(ROOT, "custom_components", "siegenia")
+SIMULATOR = os.path.join(ROOT, "tools", "siegenia_simulator.py")
+
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+import siegenia_simulator  # noqa: E402  pylint: disable=wrong-import-position
+
+
+def _load_component() -> types.ModuleType:
+    """Import the integration package without running its __init__.
+
+    device.py and const.py do not depend on Home Assistant; skipping the
+    package __init__ lets the client benchmarks run without it installed.
+    """
+    package = types.ModuleType("siegenia")
+    package.__path__ = [COMPONENT_DIR]
+    sys.modules["siegenia"] = package
+    importlib.import_module("siegenia.device")
+    return package
+
+
+_load_component()
+from siegenia.device import SiegeniaDevice  # noqa: E402  pylint: disable=wrong-import-position,import-error
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    """Return summary statistics of latencies in milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pick(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": pick(0.50),
+        "p90_ms": pick(0.90),
+        "p99_ms": pick(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _git_revision() -> str | None:
+    """Return the current git revision of the repository."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _raise_file_limit() -> None:
+    """Allow enough sockets for the largest fleet."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def _connect(
+    port: int, session: aiohttp.ClientSession, use_ssl: bool
+) -> SiegeniaDevice:
+    """Connect and log in to a simulated device.
+
+    Read coalescing and the rate limit are off so every request is measured
+    on the wire at the rate the client can sustain.
+    """
+    device = SiegeniaDevice(
+        "127.0.0.1", port, use_ssl=use_ssl, session=session, coalesce_reads=False
+    )
+    device.set_request_limits(max_in_flight=1024, rate_limit=0, max_queue=0)
+    await device.connect()
+    if not await device.login():
+        raise RuntimeError(f"Login to simulated device on port {port} failed")
+    return device
+
+
+async def bench_round_trip(args: argparse.Namespace) -> dict[str, Any]:
+    """Measure the round-trip time of sequential requests."""
+    config = siegenia_simulator.SimulatorConfig(latency=args.latency)
+    results: dict[str, Any] = {}
+    async with siegenia_simulator.SimulatorFleet(
+        1, args.base_port, config=config
+    ) as fleet, aiohttp.ClientSession() as session:
+        device = await _connect(fleet.devices[0].port, session, False)
+        try:
+            for command in ("getDeviceState", "getDeviceParams", "keepAlive"):
+                samples = []
+                for _ in range(args.requests):
+                    start = time.perf_counter()
+                    await device.send_batch([(command, None)])
+                    samples.append(time.perf_counter() - start)
+                results[command] = _percentiles(samples)
+
+            samples = []
+            for _ in range(args.requests // 3 or 1):
+                start = time.perf_counter()
+                await device.get_device_snapshot()
+                samples.append(time.perf_counter() - start)
+            results["snapshot"] = _percentiles(samples)
+        finally:
+            await device.disconnect()
+    return results
+
+
+async def bench_throughput(args: argparse.Namespace) -> dict[str, Any]:
+    """Measure requests per second with N requests in flight."""
+    # Concurrent answers measure the client, not the simulated controller
+    config = siegenia_simulator.SimulatorConfig(latency=args.latency, serial=False)
+    results: dict[str, Any] = {}
+    async with siegenia_simulator.SimulatorFleet(
+        1, args.base_port, config=config
+    ) as fleet, aiohttp.ClientSession() as session:
+        device = await _connect(fleet.devices[0].port, session, False)
+        try:
+            for in_flight in args.in_flight:
+                remaining = args.requests
+                samples: list[float] = []
+
+                async def worker() -> None:
+                    nonlocal remaining
+                    while remaining > 0:
+                        remaining -= 1
+                        start = time.perf_counter()
+                        await device.send_batch([("getDeviceState", None)])
+                        samples.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(in_flight)))
+                elapsed = time.perf_counter() - start
+                results[str(in_flight)] = {
+                    "requests_per_second": len(samples) / elapsed,
+                    "latency": _percentiles(samples),
+                }
+        finally:
+            await device.disconnect()
+    return results
+
+
+async def bench_push_latency(args: argparse.Namespace) -> dict[str, Any]:
+    """Measure latency from a device push to the data callback."""
+    results: dict[str, Any] = {}
+    async with siegenia_simulator.SimulatorFleet(
+        1, args.base_port
+    ) as fleet, aiohttp.ClientSession() as session:
+        simulated = fleet.devices[0]
+        device = await _connect(simulated.port, session, False)
+        try:
+            samples: list[float] = []
+            received = asyncio.Event()
+
+            def on_data(data: dict[str, Any]) -> None:
+                samples.append(time.perf_counter() - data["sent"])
+                received.set()
+
+            device.set_data_callback(on_data)
+            for level in range(args.pushes):
+                received.clear()
+                await simulated.push({"fanlevel": level % 8, "sent": time.perf_counter()})
+                await asyncio.wait_for(received.wait(), 5)
+            results["device_callback"] = _percentiles(samples)
+            results["coordinator"] = await _bench_coordinator_push(
+                args, simulated, device
+            )
+        finally:
+            await device.disconnect()
+    return results
+
+
+async def _bench_coordinator_push(
+    args: argparse.Namespace, simulated: Any, device: SiegeniaDevice
+) -> dict[str, Any]:
+    """Measure push latency through the coordinator to an entity listener."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.config_entries import ConfigEntry
+        from homeassistant.core import HomeAssistant
+        import inspect
+
+        coordinator_module = importlib.import_module("siegenia.coordinator")
+        storage_module = importlib.import_module("siegenia.storage")
+        model_module = importlib.import_module("siegenia.model")
+    except ImportError as err:
+        return {"skipped": f"Home Assistant not available: {err}"}
+
+    hass = HomeAssistant(os.path.join(ROOT, ".bench_config"))
+    entry_kwargs = {
+        "version": 1,
+        "minor_version": 1,
+        "domain": "siegenia",
+        "title": "benchmark",
+        "data": {
+            "host": "127.0.0.1",
+            "port": simulated.port,
+            "username": "admin",
+            "password": "0000",
+            "use_ssl": False,
+        },
+        "source": "user",
+        "options": {},
+        "unique_id": None,
+        "discovery_keys": {},
+        "subentries_data": None,
+    }
+    # ConfigEntry's signature differs between Home Assistant releases
+    accepted = inspect.signature(ConfigEntry).parameters
+    entry = ConfigEntry(**{k: v for k, v in entry_kwargs.items() if k in accepted})
+
+    coordinator = coordinator_module.SiegeniaDataUpdateCoordinator(
+        hass,
+        entry,
+        storage_module.SiegeniaTokenStore(hass),
+        storage_module.SiegeniaSnapshotStore(hass, entry.entry_id),
+    )
+    coordinator.device = device
+    device.set_data_callback(coordinator._handle_data_update)  # pylint: disable=protected-access
+    coordinator.data = model_module.SiegeniaState.from_dict(
+        {"fanlevel": -1, "deviceactive": False}
+    )
+
+    samples: list[float] = []
+    received = asyncio.Event()
+
+    def on_update() -> None:
+        samples.append(time.perf_counter() - coordinator.data.raw["sent"])
+        received.set()
+
+    unsub = coordinator.async_add_listener(on_update, frozenset({"fanlevel"}))
+    try:
+        for level in range(args.pushes):
+            received.clear()
+            await simulated.push({"fanlevel": level % 8, "sent": time.perf_counter()})
+            await asyncio.wait_for(received.wait(), 5)
+    finally:
+        unsub()
+        await hass.async_stop(force=True)
+    return {"entity_update": _percentiles(samples)}
+
+
+async def _wait_for_port(port: int, timeout: float = 30) -> None:
+    """Wait until the simulator accepts connections on a port."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+def _rss_kib() -> int:
+    """Return the current resident set size in KiB."""
+    with open("/proc/self/status", encoding="utf-8") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def bench_fleet(args: argparse.Namespace, size: int) -> dict[str, Any]:
+    """Measure CPU and memory cost per connected device."""
+    base_port = args.base_port + 1000
+    command = [
+        sys.executable, SIMULATOR,
+        "--devices", str(size),
+        "--base-port", str(base_port),
+        "--push-rate", str(args.push_rate),
+        "--latency", str(args.latency),
+    ]
+    if args.ssl:
+        command.append("--ssl")
+
+    # Run the simulator in its own process so only client cost is measured
+    simulator = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        await _wait_for_port(base_port + size - 1)
+        # Every WebSocket holds a connection, lift the default pool limit of 100
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0)
+        ) as session:
+            tracemalloc.start()
+            rss_before = _rss_kib()
+            memory_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            devices = await asyncio.gather(
+                *(_connect(base_port + index, session, args.ssl) for index in range(size))
+            )
+            connect_time = time.perf_counter() - start
+            memory_connected = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            rss_connected = _rss_kib()
+
+            pushes = 0
+
+            def on_data(_data: dict[str, Any]) -> None:
+                nonlocal pushes
+                pushes += 1
+
+            for device in devices:
+                device.set_data_callback(on_data)
+
+            # Steady state: pushes arriving plus one poll per device
+            cpu_before = time.process_time()
+            start = time.perf_counter()
+            await asyncio.gather(*(device.get_device_snapshot() for device in devices))
+            await asyncio.sleep(max(0.0, args.duration - (time.perf_counter() - start)))
+            elapsed = time.perf_counter() - start
+            cpu = time.process_time() - cpu_before
+
+            await asyncio.gather(*(device.disconnect() for device in devices))
+    finally:
+        simulator.terminate()
+        simulator.wait()
+
+    return {
+        "devices": size,
+        "connect_seconds": connect_time,
+        "python_bytes_per_device": (memory_connected - memory_before) / size,
+        "rss_kib_per_device": (rss_connected - rss_before) / size,
+        "cpu_percent": cpu / elapsed * 100,
+        "cpu_ms_per_device_per_second": cpu / elapsed / size * 1000,
+        "pushes_per_second": pushes / elapsed,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run all selected benchmarks."""
+    codec = importlib.import_module("siegenia.device").DEFAULT_CODEC.name
+    report: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "aiohttp": aiohttp.__version__,
+            "codec": codec,
+            "host": socket.gethostname(),
+            "latency": args.latency,
+        },
+    }
+    if "rtt" in args.only:
+        report["round_trip"] = await bench_round_trip(args)
+    if "throughput" in args.only:
+        report["throughput"] = await bench_throughput(args)
+    if "push" in args.only:
+        report["push_latency"] = await bench_push_latency(args)
+    if "fleet" in args.only:
+        _raise_file_limit()
+        report["fleet"] = [await bench_fleet(args, size) for size in args.fleet_sizes]
+    return report
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", nargs="+", default=["rtt", "throughput", "push", "fleet"],
+                        choices=["rtt", "throughput", "push", "fleet"])
+    parser.add_argument("--requests", type=int, default=1000, help="requests per measurement")
+    parser.add_argument("--in-flight", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--pushes", type=int, default=500, help="pushes per push latency run")
+    parser.add_argument("--fleet-sizes", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--duration", type=float, default=10.0, help="steady state seconds per fleet size")
+    parser.add_argument("--push-rate", type=float, default=0.2, help="pushes per second per device in fleet runs")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated device latency in seconds")
+    parser.add_argument("--ssl", action="store_true", help="use wss for fleet runs")
+    parser.add_argument("--base-port", type=int, default=19000)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
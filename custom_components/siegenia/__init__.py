@@ -10,35 +10,68 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN
+from .const import DATA_SNAPSHOTS, DOMAIN
 from .coordinator import SiegeniaDataUpdateCoordinator
+from .services import SERVICE_SET_FAN_LEVEL, async_setup_services
+from .storage import async_get_snapshot_store, async_get_token_store
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.FAN, Platform.NUMBER]
+PLATFORMS: list[Platform] = [Platform.FAN, Platform.NUMBER, Platform.SENSOR]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Siegenia from a config entry."""
-    coordinator = SiegeniaDataUpdateCoordinator(hass, entry)
-    
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Error communicating with Siegenia device: {err}") from err
+    token_store = await async_get_token_store(hass)
+    snapshot_store = async_get_snapshot_store(hass, entry.entry_id)
+    coordinator = SiegeniaDataUpdateCoordinator(hass, entry, token_store, snapshot_store)
+
+    if snapshot := await snapshot_store.async_load():
+        # Create entities from the last known state right away and let the
+        # live connection catch up without blocking the rest of the setup
+        coordinator.async_restore(snapshot)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {entry.title} refresh"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as err:
+            # The device reconnects on its own once connected, so it must
+            # not outlive the failed setup; the retry creates a new one
+            await coordinator.async_shutdown()
+            raise ConfigEntryNotReady(f"Error communicating with Siegenia device: {err}") from err
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_FAN_LEVEL):
+        await async_setup_services(hass)
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
         await coordinator.async_shutdown()
 
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the session token and state snapshot of a removed config entry."""
+    token_store = await async_get_token_store(hass)
+    token_store.async_set(entry.entry_id, None)
+    await async_get_snapshot_store(hass, entry.entry_id).async_remove()
+    hass.data[DATA_SNAPSHOTS].pop(entry.entry_id, None)
@@ -2,25 +2,42 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import logging
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
+    CONF_MAX_IN_FLIGHT,
+    CONF_NETWORK,
+    CONF_PUSH_COALESCE_WINDOW,
+    CONF_PUSH_QUIET_PERIOD,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
     CONF_USE_SSL,
     DEFAULT_PORT,
+    DEFAULT_PUSH_COALESCE_WINDOW,
+    DEFAULT_PUSH_QUIET_PERIOD,
     DEFAULT_USERNAME,
     DEFAULT_USE_SSL,
     DOMAIN,
+    WS_MAX_IN_FLIGHT,
+    WS_RATE_BURST,
+    WS_RATE_LIMIT,
 )
 from .device import SiegeniaDevice
+from .discovery import DiscoveredDevice, async_discover, parse_hosts
+from .handoff import async_get_handoff
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,40 +53,68 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+    """Validate the user input allows us to connect and log in.
+
+    The authenticated device is handed to the config entry created from
+    data, so setting it up does not connect a second time.
+    """
     device = SiegeniaDevice(
         host=data[CONF_HOST],
         port=data[CONF_PORT], 
         username=data[CONF_USERNAME],
         password=data[CONF_PASSWORD],
-        use_ssl=data[CONF_USE_SSL]
+        use_ssl=data[CONF_USE_SSL],
+        session=async_get_clientsession(hass, verify_ssl=False),
     )
 
     try:
         await device.connect()
-        device_info = await device.get_device_info()
-        await device.disconnect()
-        
-        return {
-            "title": f"{device_info.get('devicename', 'Siegenia Device')}",
-            "device_info": device_info
-        }
+        logged_in = await device.login()
+        device_info = await device.get_device_info() if logged_in else {}
     except Exception as err:
+        await device.disconnect()
         raise CannotConnect from err
 
+    if not logged_in:
+        # Only a rejection by the device ends up here, timeouts and dropped
+        # connections were raised above
+        await device.disconnect()
+        raise InvalidAuth
+
+    async_get_handoff(hass).async_park(data, device)
+    return {
+        "title": f"{device_info.get('devicename', 'Siegenia Device')}",
+        "device_info": device_info
+    }
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Siegenia."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._scan_data: dict[str, Any] = {}
+        self._discovered: dict[str, DiscoveredDevice] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Let the user choose between a network scan and a typed host."""
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a device entered by host."""
         errors: dict[str, str] = {}
         
         if user_input is not None:
+            # Create unique ID from host
+            await self.async_set_unique_id(user_input[CONF_HOST])
+            self._abort_if_unique_id_configured()
+
             try:
                 info = await validate_input(self.hass, user_input)
             except CannotConnect:
@@ -80,14 +125,199 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Create unique ID from host
-                await self.async_set_unique_id(user_input[CONF_HOST])
-                self._abort_if_unique_id_configured()
-                
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a subnet or address range for devices."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                hosts = parse_hosts(user_input[CONF_NETWORK])
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                devices = await async_discover(
+                    async_get_clientsession(self.hass, verify_ssl=False),
+                    hosts,
+                    user_input[CONF_PORT],
+                    user_input[CONF_USE_SSL],
+                )
+                configured = self._async_current_ids()
+                self._discovered = {
+                    device.host: device
+                    for device in devices
+                    if device.host not in configured
+                }
+                if self._discovered:
+                    self._scan_data = user_input
+                    return await self.async_step_select()
+                errors["base"] = "no_devices_found"
+
+        defaults = user_input or {
+            CONF_NETWORK: await self._async_default_network(),
+            CONF_PORT: DEFAULT_PORT,
+            CONF_USERNAME: DEFAULT_USERNAME,
+            CONF_USE_SSL: DEFAULT_USE_SSL,
+        }
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK, default=defaults[CONF_NETWORK]): str,
+                    vol.Optional(CONF_PORT, default=defaults[CONF_PORT]): int,
+                    vol.Optional(CONF_USERNAME, default=defaults[CONF_USERNAME]): str,
+                    vol.Required(CONF_PASSWORD): str,
+                    vol.Optional(CONF_USE_SSL, default=defaults[CONF_USE_SSL]): bool,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user pick which of the found devices to add."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            selected = user_input["devices"]
+            if not selected:
+                errors["base"] = "no_devices_selected"
+            else:
+                first, *others = selected
+                data = self._entry_data(first)
+                await self.async_set_unique_id(first)
+                self._abort_if_unique_id_configured()
+                try:
+                    info = await validate_input(self.hass, data)
+                except CannotConnect:
+                    errors["base"] = "cannot_connect"
+                except InvalidAuth:
+                    errors["base"] = "invalid_auth"
+                else:
+                    # This flow creates the first entry, every further device
+                    # gets an import flow of its own
+                    for host in others:
+                        self.hass.async_create_task(
+                            self.hass.config_entries.flow.async_init(
+                                DOMAIN,
+                                context={"source": config_entries.SOURCE_IMPORT},
+                                data=self._entry_data(host),
+                            )
+                        )
+                    return self.async_create_entry(title=info["title"], data=data)
+
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        "devices", default=list(self._discovered)
+                    ): cv.multi_select(
+                        {
+                            host: f"{device.name} ({device.model}, {host})"
+                            for host, device in self._discovered.items()
+                        }
+                    ),
+                }
+            ),
+            errors=errors,
+            description_placeholders={"count": str(len(self._discovered))},
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Add a device picked in the scan of another flow."""
+        await self.async_set_unique_id(import_data[CONF_HOST])
+        self._abort_if_unique_id_configured()
+
+        try:
+            info = await validate_input(self.hass, import_data)
+        except CannotConnect:
+            return self.async_abort(reason="cannot_connect")
+        except InvalidAuth:
+            return self.async_abort(reason="invalid_auth")
+
+        return self.async_create_entry(title=info["title"], data=import_data)
+
+    def _entry_data(self, host: str) -> dict[str, Any]:
+        """Return the config entry data of a discovered device."""
+        return {
+            CONF_HOST: host,
+            CONF_PORT: self._scan_data[CONF_PORT],
+            CONF_USERNAME: self._scan_data[CONF_USERNAME],
+            CONF_PASSWORD: self._scan_data[CONF_PASSWORD],
+            CONF_USE_SSL: self._scan_data[CONF_USE_SSL],
+        }
+
+    async def _async_default_network(self) -> str:
+        """Return the /24 of Home Assistant's own address as scan default."""
+        try:
+            source_ip = await network.async_get_source_ip(self.hass)
+            return str(ipaddress.IPv4Network(f"{source_ip}/24", strict=False))
+        except Exception:  # pylint: disable=broad-except
+            return ""
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Siegenia options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PUSH_QUIET_PERIOD,
+                        default=options.get(
+                            CONF_PUSH_QUIET_PERIOD, DEFAULT_PUSH_QUIET_PERIOD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+                    vol.Optional(
+                        CONF_MAX_IN_FLIGHT,
+                        default=options.get(CONF_MAX_IN_FLIGHT, WS_MAX_IN_FLIGHT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_RATE_LIMIT,
+                        default=options.get(CONF_RATE_LIMIT, WS_RATE_LIMIT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_RATE_BURST,
+                        default=options.get(CONF_RATE_BURST, WS_RATE_BURST),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+                    vol.Optional(
+                        CONF_PUSH_COALESCE_WINDOW,
+                        default=options.get(
+                            CONF_PUSH_COALESCE_WINDOW, DEFAULT_PUSH_COALESCE_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                }
+            ),
         )
 
 
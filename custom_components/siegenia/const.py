@@ -2,6 +2,26 @@
 
 DOMAIN = "siegenia"
 
+# hass.data key of the integration-wide fleet scheduler
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+# hass.data key of the long-life session token store
+DATA_TOKENS = f"{DOMAIN}_tokens"
+# hass.data key of the entity and device to coordinator index
+DATA_INDEX = f"{DOMAIN}_index"
+# hass.data key of the connections handed from the config flow to the entry
+DATA_HANDOFF = f"{DOMAIN}_handoff"
+# hass.data key of the state snapshot stores, keyed by config entry
+DATA_SNAPSHOTS = f"{DOMAIN}_snapshots"
+
+# Home Assistant storage
+STORAGE_VERSION = 1
+STORAGE_KEY_TOKENS = f"{DOMAIN}.tokens"
+STORAGE_SAVE_DELAY = 10
+SNAPSHOT_SAVE_DELAY = 60
+
+# State changes kept in memory per device for the history service
+HISTORY_SIZE = 1024
+
 # Configuration constants
 CONF_HOST = "host"
 CONF_PORT = "port"
@@ -9,10 +29,24 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_USE_SSL = "use_ssl"
 
+# Network scan in the config flow
+CONF_NETWORK = "network"
+
+# Options
+CONF_PUSH_QUIET_PERIOD = "push_quiet_period"
+CONF_MAX_IN_FLIGHT = "max_in_flight"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+CONF_PUSH_COALESCE_WINDOW = "push_coalesce_window"
+
 # Default values
 DEFAULT_PORT = 443
 DEFAULT_USERNAME = "admin"
 DEFAULT_USE_SSL = True
+DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_PUSH_QUIET_PERIOD = 300
+# Milliseconds to merge pushes into one update, 0 publishes each push
+DEFAULT_PUSH_COALESCE_WINDOW = 0
 
 # Device types from ioBroker adapter
 DEVICE_TYPE_MAP = {
@@ -42,4 +76,52 @@ AEROPAC_FAN_LEVELS = {
 
 # WebSocket timeouts
 WS_TIMEOUT = 10
-WS_HEARTBEAT_INTERVAL = 30
\ No newline at end of file
+WS_HEARTBEAT_INTERVAL = 30
+
+# Requests sent to a device without a response yet; further requests wait
+# in the priority queue. Reads and keepAlives leave WS_RESERVED_FOR_WRITES of
+# these free so a user command never waits behind a poll.
+WS_MAX_IN_FLIGHT = 4
+WS_RESERVED_FOR_WRITES = 1
+
+# Token bucket per device: sustained requests per second (0 = unlimited)
+# and the burst sent without waiting
+WS_RATE_LIMIT = 10.0
+WS_RATE_BURST = 5
+
+# Requests waiting for a free in-flight slot; beyond this the least important is dropped
+WS_MAX_QUEUE = 32
+
+# Seconds a read response is served from memory to near-simultaneous callers
+READ_CACHE_TTL = 1.0
+
+# Reconnect after this many failed keepAlives in a row, or after this many
+# keepAlives in a row slower than KEEPALIVE_DEGRADED_RTT seconds
+KEEPALIVE_MAX_FAILURES = 2
+KEEPALIVE_DEGRADED_COUNT = 3
+KEEPALIVE_DEGRADED_RTT = 3
+
+# Reconnect backoff (seconds)
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 60
+
+# Seconds to wait for a push confirming an optimistic write
+OPTIMISTIC_CONFIRM_TIMEOUT = 5
+
+# Seconds to collect parameter changes into one setDeviceParams write
+WRITE_FLUSH_WINDOW = 0.25
+
+# Fleet scheduling: concurrent device operations and seconds between starts
+FLEET_MAX_CONCURRENT = 8
+FLEET_START_SPACING = 0.1
+
+# Devices a service call writes to at the same time
+SERVICE_MAX_CONCURRENT = 64
+
+# Seconds a connection validated by the config flow is kept for its entry
+HANDOFF_TIMEOUT = 60
+
+# Network scan: concurrent probes, seconds per probe and addresses per scan
+DISCOVERY_MAX_CONCURRENT = 64
+DISCOVERY_TIMEOUT = 2
+DISCOVERY_MAX_HOSTS = 1024
\ No newline at end of file
@@ -4,91 +4,478 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_USE_SSL, DOMAIN
+from .const import (
+    CONF_MAX_IN_FLIGHT,
+    CONF_PUSH_COALESCE_WINDOW,
+    CONF_PUSH_QUIET_PERIOD,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_USE_SSL,
+    DEFAULT_PUSH_COALESCE_WINDOW,
+    DEFAULT_PUSH_QUIET_PERIOD,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    HISTORY_SIZE,
+    OPTIMISTIC_CONFIRM_TIMEOUT,
+    WRITE_FLUSH_WINDOW,
+    WS_MAX_IN_FLIGHT,
+    WS_RATE_BURST,
+    WS_RATE_LIMIT,
+)
 from .device import SiegeniaDevice
+from .handoff import async_get_handoff
+from .history import StateHistory
+from .model import SiegeniaState
+from .scheduler import async_get_scheduler
+from .storage import SiegeniaSnapshotStore, SiegeniaTokenStore
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator):
+def _merge_params(target: dict[str, Any], params: dict[str, Any]) -> None:
+    """Deep merge setDeviceParams payloads, later values win."""
+    for key, value in params.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_params(target[key], value)
+        else:
+            target[key] = value
+
+
+class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[SiegeniaState]):
     """Class to manage fetching data from the Siegenia device."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        token_store: SiegeniaTokenStore,
+        snapshot_store: SiegeniaSnapshotStore,
+    ) -> None:
         """Initialize."""
         self.entry = entry
-        self.device = SiegeniaDevice(
-            host=entry.data[CONF_HOST],
-            port=entry.data[CONF_PORT],
-            username=entry.data[CONF_USERNAME], 
-            password=entry.data[CONF_PASSWORD],
-            use_ssl=entry.data[CONF_USE_SSL]
-        )
-        
+        self._snapshot_store = snapshot_store
+        if device := async_get_handoff(hass).async_adopt(entry.data):
+            # Logged in by the config flow moments ago, keep its session
+            device.auto_reconnect = True
+            token_store.async_set(entry.entry_id, device.token)
+        else:
+            device = SiegeniaDevice(
+                host=entry.data[CONF_HOST],
+                port=entry.data[CONF_PORT],
+                username=entry.data[CONF_USERNAME],
+                password=entry.data[CONF_PASSWORD],
+                use_ssl=entry.data[CONF_USE_SSL],
+                session=async_get_clientsession(hass, verify_ssl=False),
+                auto_reconnect=True,
+                token=token_store.get(entry.entry_id),
+            )
+        self.device = device
+
         # Set up data callback for real-time updates
         self.device.set_data_callback(self._handle_data_update)
-        
+        self.device.set_connection_lost_callback(self._handle_connection_lost)
+        self.device.set_reconnected_callback(self._handle_reconnected)
+        self.device.set_token_callback(
+            lambda token: token_store.async_set(entry.entry_id, token)
+        )
+
+        # Connects and polls of all entries share the fleet scheduler
+        self._scheduler = async_get_scheduler(hass)
+        self.device.set_connect_limiter(lambda: self._scheduler.async_slot("reconnect"))
+
+        # Protect the embedded controller from bursts
+        self.device.set_request_limits(
+            max_in_flight=entry.options.get(CONF_MAX_IN_FLIGHT, WS_MAX_IN_FLIGHT),
+            rate_limit=entry.options.get(CONF_RATE_LIMIT, WS_RATE_LIMIT),
+            rate_burst=entry.options.get(CONF_RATE_BURST, WS_RATE_BURST),
+        )
+
+        # Poll at the scan interval until the device starts pushing, then
+        # only reconcile after the push stream has been quiet for a while
+        self._scan_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        self._push_quiet_period = timedelta(
+            seconds=entry.options.get(CONF_PUSH_QUIET_PERIOD, DEFAULT_PUSH_QUIET_PERIOD)
+        )
+        self._push_active = False
+
+        # Push coalescing: pushes merged until the window closes
+        self._push_coalesce_window = (
+            entry.options.get(CONF_PUSH_COALESCE_WINDOW, DEFAULT_PUSH_COALESCE_WINDOW)
+            / 1000
+        )
+        self._pending_push: dict[str, Any] = {}
+        self._unsub_push: CALLBACK_TYPE | None = None
+
+        # Write batching: changes queued until the flush window closes
+        self._pending_params: dict[str, Any] = {}
+        self._pending_values: dict[str, Any] = {}
+        self._pending_previous: dict[str, Any] = {}
+        self._write_waiters: list[asyncio.Future[None]] = []
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+        # Keys changed by the update being published, None for a full update
+        self._changed_keys: set[str] | None = None
+
+        # Pending check that an optimistic write was confirmed by a push
+        self._unsub_confirm: CALLBACK_TYPE | None = None
+
+        # Short-term state changes, kept out of the recorder
+        self.history = StateHistory(HISTORY_SIZE)
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=self._scan_interval,
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    @property
+    def push_active(self) -> bool:
+        """Return True while the device push stream is healthy."""
+        return self._push_active
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device registry information from the metadata cache."""
+        device_info = self.device.device_info
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.entry.entry_id)},
+            name=device_info.get("devicename", "Siegenia Device"),
+            manufacturer="Siegenia",
+            model=device_info.get("type", "Unknown"),
+            sw_version=device_info.get("softwareversion"),
+            hw_version=device_info.get("hardwareversion"),
+            serial_number=device_info.get("serialnr"),
+        )
+
+    @callback
+    def async_restore(self, snapshot: dict[str, Any]) -> None:
+        """Start from the last known data until the device is reachable."""
+        self.device.restore_device_info(snapshot.get("device_info", {}))
+        self.data = SiegeniaState.from_dict(snapshot)
+
+    async def async_refresh_device_info(self) -> None:
+        """Drop the cached device information and fetch it again."""
+        self.device.invalidate_device_info()
+        await self.async_request_refresh()
+
+    async def _async_update_data(self) -> SiegeniaState:
         """Update data via library."""
         try:
             if not self.device.is_connected:
-                await self.device.connect()
-                if not await self.device.login():
-                    raise UpdateFailed("Failed to login to device")
-
-            # Get current device state and parameters
-            device_state = await self.device.get_device_state()
-            device_params = await self.device.get_device_params()
-            device_info = await self.device.get_device_info()
-            
-            # Merge all data
-            data = {
-                **device_state,
-                **device_params,
-                "device_info": device_info
-            }
-            
-            _LOGGER.debug("Updated data: %s", data)
-            return data
+                # Pushes sent before the reconnect are gone, so poll at the
+                # normal rate until the stream proves itself again
+                self._set_push_active(False)
+                if self.device.is_reconnecting:
+                    raise UpdateFailed("Reconnecting to device")
+                async with self._scheduler.async_slot("connect"):
+                    await self.device.connect()
+                    try:
+                        if not await self.device.login():
+                            raise UpdateFailed("Failed to login to device")
+                    except BaseException:
+                        # Do not leave an unauthenticated socket behind
+                        await self.device.disconnect()
+                        raise
+
+            # Get current device state, parameters and info in one round trip;
+            # the info comes from the metadata cache unless it went stale
+            async with self._scheduler.async_slot("poll"):
+                device_state, device_params, device_info = (
+                    await self.device.get_device_snapshot()
+                )
+
+            if self.data and device_info != self.data.device_info:
+                self._async_update_device_registry()
+
+            # Pushes still held back in the coalescing window are older than
+            # the snapshot, which already contains their values
+            if self._unsub_push:
+                self._unsub_push()
+                self._unsub_push = None
+            self._pending_push.clear()
+
+            # Parse only what changed into the existing state
+            state = self.data or SiegeniaState()
+            state.apply(device_state)
+            state.apply(device_params)
+            state.device_info = device_info
+
+            _LOGGER.debug("Updated data: %s", state.raw)
+            self.history.record(state)
+            return state
             
+        except UpdateFailed:
+            raise
         except Exception as err:
             _LOGGER.error("Error communicating with device: %s", err)
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        if self._unsub_confirm:
+            self._unsub_confirm()
+            self._unsub_confirm = None
+        if self._unsub_push:
+            self._unsub_push()
+            self._unsub_push = None
+            self._pending_push.clear()
+        if self._unsub_flush:
+            # Send what is still queued rather than dropping a user's change
+            self._unsub_flush()
+            self._unsub_flush = None
+            await self._async_write_pending()
         if self.device:
             await self.device.disconnect()
+        # Do not leave a delayed save running past the entry
+        await self._snapshot_store.async_flush()
 
     def _handle_data_update(self, data: dict[str, Any]) -> None:
         """Handle real-time data updates from device."""
         _LOGGER.debug("Received real-time update: %s", data)
+        self._set_push_active(True)
+        if self._unsub_confirm:
+            # The device confirmed the optimistic state
+            self._unsub_confirm()
+            self._unsub_confirm = None
+
+        # A firmware change seen in the push needs fresh metadata
+        if self.device.device_info_stale:
+            self.hass.async_create_task(self.async_request_refresh())
+
+        if not self.data:
+            return
+
+        if self._push_coalesce_window:
+            # Merge the burst and publish it once when the window closes;
+            # the window is not extended, so no push waits longer than that
+            self._pending_push.update(data)
+            if self._unsub_push is None:
+                self._unsub_push = async_call_later(
+                    self.hass, self._push_coalesce_window, self._async_flush_pushes
+                )
+            return
+
+        self._async_apply_push(data)
+
+    @callback
+    def _async_flush_pushes(self, _now: Any = None) -> None:
+        """Publish the pushes merged in the coalescing window."""
+        if self._unsub_push:
+            self._unsub_push()
+            self._unsub_push = None
+        pushed, self._pending_push = self._pending_push, {}
+        if pushed and self.data:
+            self._async_apply_push(pushed)
+
+    @callback
+    def _async_apply_push(self, data: dict[str, Any]) -> None:
+        """Merge pushed data into the state and publish what changed."""
+        # Update the state in place and wake only the entities that
+        # depend on the changed keys; this also pushes the next
+        # reconciliation poll out by the quiet period
+        if not (changed := self.data.apply(data)):
+            # Identical push, nothing for the entities to do
+            return
+
+        self.history.record(self.data)
+        self._async_set_changed_data(changed)
+
+    @callback
+    def _async_set_changed_data(self, changed: set[str]) -> None:
+        """Publish self.data, notifying only listeners of the changed keys.
+
+        After a failed refresh every entity is unavailable, so the first
+        update that succeeds again notifies all listeners.
+        """
+        self._changed_keys = changed if self.last_update_success else None
+        self.async_set_updated_data(self.data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners whose context shares a key with the change.
+
+        Entities register the data keys they depend on as their coordinator
+        context. Listeners without a context, and every listener on a full
+        refresh, are always updated.
+        """
+        changed, self._changed_keys = self._changed_keys, None
         if self.data:
-            # Update existing data with new values
-            self.data.update(data)
-            # Trigger update to all listening entities
-            self.async_set_updated_data(self.data)
+            self._snapshot_store.async_schedule_save(self.data)
+        if changed is None:
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    @callback
+    def _async_update_device_registry(self) -> None:
+        """Push changed device information to the device registry."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, self.entry.entry_id)}
+        )
+        if device is None:
+            return
+
+        info = self.device_info
+        device_registry.async_update_device(
+            device.id,
+            name=info["name"],
+            model=info["model"],
+            sw_version=info["sw_version"],
+            hw_version=info["hw_version"],
+            serial_number=info["serial_number"],
+        )
+
+    @callback
+    def _handle_connection_lost(self) -> None:
+        """Fall back to polling after the socket dropped."""
+        _LOGGER.debug("Connection to %s lost, resuming polling", self.device.host)
+        self._set_push_active(False)
+        # Without the supervisor the next refresh has to reconnect
+        if not self.device.is_reconnecting:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_reconnected(self) -> None:
+        """Resync the full state once the supervisor is back online."""
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _set_push_active(self, active: bool) -> None:
+        """Switch between push-first and polling mode."""
+        if active == self._push_active:
+            return
+        self._push_active = active
+        self.update_interval = self._push_quiet_period if active else self._scan_interval
+        _LOGGER.debug(
+            "Push stream for %s %s, polling every %s",
+            self.device.host,
+            "active" if active else "inactive",
+            self.update_interval,
+        )
 
     async def async_set_fan_level(self, level: int) -> None:
         """Set fan level."""
-        await self.device.set_fan_level(level)
-        # Trigger immediate data refresh
-        await self.async_request_refresh()
+        await self.async_set_state(fan_level=level)
 
     async def async_set_device_active(self, active: bool) -> None:
         """Set device active state."""
-        await self.device.set_device_active(active)
-        # Trigger immediate data refresh  
-        await self.async_request_refresh()
\ No newline at end of file
+        await self.async_set_state(active=active)
+
+    async def async_set_state(
+        self, *, active: bool | None = None, fan_level: int | None = None
+    ) -> None:
+        """Change device state through the write batching layer.
+
+        Changes are applied to the data optimistically and merged with any
+        other change queued within the flush window, so only one
+        setDeviceParams request carrying the latest values is sent. A
+        superseded value (e.g. while dragging the slider) never reaches the
+        device. Returns once the merged write has completed.
+        """
+        params: dict[str, Any] = {}
+        values: dict[str, Any] = {}
+        if active is not None:
+            params["devicestate"] = {"deviceactive": active}
+            values["deviceactive"] = active
+        if fan_level is not None:
+            if not 0 <= fan_level <= 7:
+                raise ValueError("Fan level must be between 0 and 7")
+            params["fanlevel"] = fan_level
+            values["fanlevel"] = fan_level
+        if not params:
+            return
+
+        _merge_params(self._pending_params, params)
+        self._pending_values.update(values)
+
+        # Apply optimistically, remembering what the batch replaced; pushes
+        # still held back describe the state before this change
+        self._async_flush_pushes()
+        if self.data is not None:
+            for key in values:
+                self._pending_previous.setdefault(key, self.data.raw.get(key))
+            self._async_set_changed_data(self.data.apply(values))
+
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._write_waiters.append(future)
+
+        # Debounce: every change pushes the flush out by another window
+        if self._unsub_flush:
+            self._unsub_flush()
+        self._unsub_flush = async_call_later(
+            self.hass, WRITE_FLUSH_WINDOW, self._async_flush_writes
+        )
+
+        await future
+
+    @callback
+    def _async_flush_writes(self, _now: Any) -> None:
+        """Send all changes queued in the flush window."""
+        self._unsub_flush = None
+        self.hass.async_create_task(self._async_write_pending())
+
+    async def _async_write_pending(self) -> None:
+        """Write the merged parameters and settle everyone waiting on them."""
+        params, self._pending_params = self._pending_params, {}
+        values, self._pending_values = self._pending_values, {}
+        previous, self._pending_previous = self._pending_previous, {}
+        waiters, self._write_waiters = self._write_waiters, []
+
+        _LOGGER.debug("Writing %s to %s", params, self.device.host)
+        try:
+            if not await self.device.set_device_params(params):
+                raise HomeAssistantError(f"Device {self.device.host} rejected {params}")
+        except Exception as err:  # pylint: disable=broad-except
+            self._async_rollback(values, previous)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        # The device should confirm the write with a push
+        if self._unsub_confirm:
+            self._unsub_confirm()
+        self._unsub_confirm = async_call_later(
+            self.hass, OPTIMISTIC_CONFIRM_TIMEOUT, self._async_confirm_timeout
+        )
+
+    @callback
+    def _async_rollback(self, values: dict[str, Any], previous: dict[str, Any]) -> None:
+        """Restore values replaced by a failed optimistic write."""
+        if self.data is None or not previous:
+            return
+
+        # Leave keys alone that a push or a later write has changed since
+        restore = {
+            key: value
+            for key, value in previous.items()
+            if value is not None and self.data.raw.get(key) == values[key]
+        }
+        self._async_set_changed_data(self.data.apply(restore))
+
+    @callback
+    def _async_confirm_timeout(self, _now: Any) -> None:
+        """Reconcile the state when no push confirmed a write."""
+        self._unsub_confirm = None
+        _LOGGER.debug("No push confirmed write to %s, refreshing", self.device.host)
+        self.hass.async_create_task(self.async_request_refresh())
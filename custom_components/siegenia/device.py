@@ -2,19 +2,187 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
+import random
 import ssl
-from typing import Any, Callable
+from contextlib import AbstractAsyncContextManager
+from enum import IntEnum
+from functools import partial
+from typing import Any, Callable, NamedTuple
 
 import aiohttp
 from aiohttp import ClientSession, ClientWebSocketResponse
 
-from .const import WS_HEARTBEAT_INTERVAL, WS_TIMEOUT
+from .const import (
+    KEEPALIVE_DEGRADED_COUNT,
+    KEEPALIVE_DEGRADED_RTT,
+    KEEPALIVE_MAX_FAILURES,
+    RECONNECT_MAX_DELAY,
+    RECONNECT_MIN_DELAY,
+    READ_CACHE_TTL,
+    WS_HEARTBEAT_INTERVAL,
+    WS_MAX_IN_FLIGHT,
+    WS_MAX_QUEUE,
+    WS_RATE_BURST,
+    WS_RATE_LIMIT,
+    WS_RESERVED_FOR_WRITES,
+    WS_TIMEOUT,
+)
+from .metrics import DeviceMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class JsonCodec(NamedTuple):
+    """JSON encoder/decoder pair used on the WebSocket."""
+
+    name: str
+    dumps: Callable[[Any], str]
+    loads: Callable[[str | bytes], Any]
+
+
+def _default_codec() -> JsonCodec:
+    """Return the fastest available codec, orjson if installed."""
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return JsonCodec(
+            "json", lambda obj: json.dumps(obj, separators=(",", ":")), json.loads
+        )
+    return JsonCodec("orjson", lambda obj: orjson.dumps(obj).decode(), orjson.loads)
+
+
+DEFAULT_CODEC = _default_codec()
+
+
+class RttEstimator:
+    """Smoothed round-trip time and jitter as in RFC 6298."""
+
+    __slots__ = ("srtt", "rttvar", "last", "samples")
+
+    def __init__(self) -> None:
+        """Initialize the estimator."""
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self.last: float | None = None
+        self.samples = 0
+
+    def add(self, rtt: float) -> None:
+        """Add a round-trip time sample in seconds."""
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.last = rtt
+        self.samples += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimate in milliseconds."""
+        return {
+            "srtt_ms": self.srtt * 1000 if self.srtt is not None else None,
+            "jitter_ms": self.rttvar * 1000 if self.rttvar is not None else None,
+            "last_ms": self.last * 1000 if self.last is not None else None,
+            "samples": self.samples,
+        }
+
+
+class RequestPriority(IntEnum):
+    """Send order of queued requests, lowest value first."""
+
+    WRITE = 0
+    READ = 1
+    KEEPALIVE = 2
+
+
+# Priority of a command unless the caller passes one; login shares the write
+# priority since nothing else can be answered before it
+COMMAND_PRIORITY = {
+    "login": RequestPriority.WRITE,
+    "setDeviceParams": RequestPriority.WRITE,
+    "keepAlive": RequestPriority.KEEPALIVE,
+}
+
+
+class RequestDropped(ConnectionError):
+    """A queued request was dropped to make room for a more important one."""
+
+
+class TokenBucket:
+    """Token bucket limiting the request rate to a device."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket; a rate of 0 disables the limit."""
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = 0.0
+
+    def delay(self, now: float) -> float:
+        """Take a token and return 0, or return the seconds until one is free."""
+        if self.rate <= 0:
+            return 0.0
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Tolerate float rounding after sleeping exactly the returned delay
+        if self.tokens >= 1 - 1e-9:
+            self.tokens = max(0.0, self.tokens - 1)
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class _Request:
+    """A request on its way through the send queue."""
+
+    __slots__ = (
+        "command", "params", "fields", "priority", "key", "generation",
+        "future", "waiters", "queued_at", "request_id", "sent_at", "timer",
+    )
+
+    def __init__(
+        self,
+        command: str,
+        params: dict[str, Any] | None,
+        fields: dict[str, Any] | None,
+        priority: RequestPriority,
+        key: tuple[str, str] | None,
+        generation: int,
+        future: asyncio.Future,
+    ) -> None:
+        """Initialize the request."""
+        self.command = command
+        self.params = params
+        self.fields = fields
+        self.priority = priority
+        self.key = key
+        self.generation = generation
+        self.future = future
+        self.waiters = 1
+        self.queued_at = 0.0
+        self.request_id: int | None = None
+        self.sent_at: float | None = None
+        self.timer: asyncio.TimerHandle | None = None
+
+
+def _create_no_verify_ssl_context() -> ssl.SSLContext:
+    """Create an SSL context that accepts self-signed certificates."""
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+# Creating an SSL context is expensive and blocks, so all devices share one
+# that is built once at import time
+NO_VERIFY_SSL_CONTEXT = _create_no_verify_ssl_context()
+
+
 class SiegeniaDevice:
     """Siegenia device WebSocket client."""
 
@@ -25,42 +193,114 @@ class SiegeniaDevice:
         username: str = "admin",
         password: str = "0000",
         use_ssl: bool = True,
+        session: ClientSession | None = None,
+        auto_reconnect: bool = False,
+        codec: JsonCodec = DEFAULT_CODEC,
+        token: str | None = None,
+        coalesce_reads: bool = True,
     ) -> None:
-        """Initialize the device."""
+        """Initialize the device.
+
+        Pass a shared session to pool connections across devices; without one
+        the device creates and owns a private session. With auto_reconnect the
+        device reconnects and logs in again on its own after the socket drops.
+        The codec defaults to orjson when available and stdlib json otherwise.
+        A long-life token from an earlier session can be passed to skip the
+        password login. With coalesce_reads concurrent identical reads share
+        one request and are briefly cached.
+        """
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.use_ssl = use_ssl
+        self.auto_reconnect = auto_reconnect
+        self.coalesce_reads = coalesce_reads
+        self._codec = codec
         
-        self._session: ClientSession | None = None
+        self._session: ClientSession | None = session
+        self._owns_session = session is None
         self._websocket: ClientWebSocketResponse | None = None
         self._request_id = 0
-        self._awaiting_responses: dict[int, asyncio.Future] = {}
+        self._awaiting_responses: dict[int, _Request] = {}
+        self._send_queue: list[tuple[int, int, _Request]] = []
+        self._shared_reads: dict[tuple[str, str], _Request] = {}
+        self._read_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        self._read_generation = 0
+        self._queue_seq = itertools.count()
+        self._max_in_flight = WS_MAX_IN_FLIGHT
+        self._max_queue = WS_MAX_QUEUE
+        self._bucket = TokenBucket(WS_RATE_LIMIT, WS_RATE_BURST)
+        self._queue_ready = asyncio.Event()
+        self._sender_task: asyncio.Task | None = None
         self._heartbeat_task: asyncio.Task | None = None
-        self._token: str | None = None
+        self._listener_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._closing = False
+        self._last_activity = 0.0
+        self._rtt = RttEstimator()
+        self._metrics = DeviceMetrics()
+        self._token: str | None = token
         self._device_info: dict[str, Any] = {}
+        self._device_info_stale = True
         self._data_callback: Callable[[dict[str, Any]], None] | None = None
+        self._connection_lost_callback: Callable[[], None] | None = None
+        self._token_callback: Callable[[str | None], None] | None = None
+        self._reconnected_callback: Callable[[], None] | None = None
+        self._connect_limiter: Callable[[], AbstractAsyncContextManager] | None = None
 
     @property
     def is_connected(self) -> bool:
         """Return if device is connected."""
         return self._websocket is not None and not self._websocket.closed
 
+    @property
+    def is_reconnecting(self) -> bool:
+        """Return if the reconnect supervisor is currently running."""
+        return self._reconnect_task is not None and not self._reconnect_task.done()
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return the cached device information (getDevice)."""
+        return self._device_info
+
+    @property
+    def device_info_stale(self) -> bool:
+        """Return True if the device information needs to be fetched again."""
+        return self._device_info_stale or not self._device_info
+
+    def restore_device_info(self, device_info: dict[str, Any]) -> None:
+        """Seed the cache with device information from an earlier run.
+
+        The restored data is served right away but is still fetched again on
+        the next refresh.
+        """
+        self._device_info = device_info
+        self._device_info_stale = True
+
+    def invalidate_device_info(self) -> None:
+        """Mark the cached device information as stale.
+
+        The cached data stays readable until the next fetch replaces it.
+        """
+        self._device_info_stale = True
+
     async def connect(self) -> None:
         """Connect to the device."""
         if self._session is None:
             self._session = aiohttp.ClientSession()
+            self._owns_session = True
 
         protocol = "wss" if self.use_ssl else "ws"
         url = f"{protocol}://{self.host}:{self.port}/WebSocket"
+        self._closing = False
+
+        # The device may have been updated while we were away
+        self._device_info_stale = True
+        self._last_activity = asyncio.get_running_loop().time()
         
         # SSL context that accepts self-signed certificates
-        ssl_context = None
-        if self.use_ssl:
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        ssl_context = NO_VERIFY_SSL_CONTEXT if self.use_ssl else None
         
         try:
             self._websocket = await self._session.ws_connect(
@@ -75,103 +315,140 @@ class SiegeniaDevice:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             
             # Start message listener
-            asyncio.create_task(self._listen_for_messages())
+            self._listener_task = asyncio.create_task(self._listen_for_messages())
+
+            # Start sending queued requests
+            self._sender_task = asyncio.create_task(self._sender_loop())
             
+            self._metrics.connects += 1
             _LOGGER.info("Connected to Siegenia device at %s:%s", self.host, self.port)
             
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Failed to connect to %s:%s - %s", self.host, self.port, err)
-            await self.disconnect()
+            await self._close_connection()
             raise ConnectionError(f"Cannot connect to {self.host}:{self.port}") from err
         except Exception as err:
             _LOGGER.error("Unexpected error connecting to %s:%s - %s", self.host, self.port, err)
-            await self.disconnect()
+            await self._close_connection()
             raise
 
     async def disconnect(self) -> None:
         """Disconnect from the device."""
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            self._heartbeat_task = None
+        self._closing = True
 
-        if self._websocket and not self._websocket.closed:
-            await self._websocket.close()
-            
-        if self._session:
+        if self._reconnect_task and self._reconnect_task is not asyncio.current_task():
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        await self._close_connection()
+
+        # A shared session belongs to the caller and stays open
+        if self._session and self._owns_session:
             await self._session.close()
             self._session = None
-            
+
+    async def _close_connection(self) -> None:
+        """Close the socket and fail everything still waiting on it."""
+        if self._heartbeat_task:
+            # The heartbeat itself may be closing a degraded connection
+            if self._heartbeat_task is not asyncio.current_task():
+                self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+        if self._sender_task:
+            self._sender_task.cancel()
+            self._sender_task = None
+
+        websocket = self._websocket
         self._websocket = None
-        self._token = None
+        self._listener_task = None
+        if websocket and not websocket.closed:
+            await websocket.close()
+
+        self._fail_pending_requests()
+
+    def _fail_pending_requests(self) -> None:
+        """Fail all queued requests and those waiting for a response right away."""
+        awaiting, self._awaiting_responses = self._awaiting_responses, {}
+        queued, self._send_queue = self._send_queue, []
+        self._invalidate_reads()
+        for request in [*awaiting.values(), *(request for _, _, request in queued)]:
+            if not request.future.done():
+                request.future.set_exception(
+                    ConnectionError(f"Connection to {self.host}:{self.port} lost")
+                )
 
     async def login(self) -> bool:
-        """Login to the device."""
-        try:
-            request = {
-                "command": "login",
-                "user": self.username,
-                "password": self.password,
-                "long_life": False,
-                "id": self._get_next_request_id()
-            }
-            
-            # Create future for response
-            future = asyncio.Future()
-            self._awaiting_responses[request["id"]] = future
+        """Login to the device.
 
-            # Send request
-            await self._websocket.send_str(json.dumps(request))
-            _LOGGER.debug("Sent login request: %s", json.dumps(request))
-            
-            # Wait for response
-            response = await asyncio.wait_for(future, timeout=WS_TIMEOUT)
-            
-            if response.get("status") == "ok" and "data" in response:
-                self._token = response["data"].get("token")
-                _LOGGER.info("Successfully logged in to device %s", self.host)
-                return True
-            else:
-                _LOGGER.error("Login failed: %s", response.get("status", "Unknown error"))
-                return False
-                
-        except Exception as err:
-            _LOGGER.error("Login error: %s", err)
-            return False
+        A stored long-life token is tried first, so reconnects skip the
+        password check. If the device rejects the token, the password login
+        requests a new long-life token.
+
+        Returns False only if the device rejected the credentials; transport
+        errors and timeouts are raised, so callers can tell them apart.
+        """
+        if self._token and await self._login({"token": self._token, "long_life": True}):
+            return True
+
+        return await self._login(
+            {"user": self.username, "password": self.password, "long_life": True}
+        )
+
+    async def _login(self, fields: dict[str, Any]) -> bool:
+        """Send a login request with the given credentials."""
+        response = await self._send_request("login", fields=fields)
+
+        if response.get("status") == "ok" and "data" in response:
+            token = response["data"].get("token") or fields.get("token")
+            if token != self._token:
+                self._token = token
+                if self._token_callback:
+                    self._token_callback(token)
+            _LOGGER.info("Successfully logged in to device %s", self.host)
+            return True
+
+        if "token" in fields:
+            _LOGGER.debug("Device %s rejected the stored token", self.host)
+        else:
+            _LOGGER.error("Login failed: %s", response.get("status", "Unknown error"))
+        return False
+
+    async def get_device_info(self, refresh: bool = False) -> dict[str, Any]:
+        """Get device information, served from the cache unless stale."""
+        if self._device_info and not self._device_info_stale and not refresh:
+            return self._device_info
 
-    async def get_device_info(self) -> dict[str, Any]:
-        """Get device information."""
         response = await self._send_request("getDevice")
         if response.get("status") == "ok" and "data" in response:
             self._device_info = response["data"]
+            self._device_info_stale = False
             return self._device_info
         return {}
 
     async def get_device_params(self) -> dict[str, Any]:
         """Get device parameters."""
         response = await self._send_request("getDeviceParams")
-        if response.get("status") == "ok" and "data" in response:
-            return response["data"]
-        return {}
+        return self._response_data(response)
 
     async def get_device_state(self) -> dict[str, Any]:
         """Get device state."""
         response = await self._send_request("getDeviceState")
-        if response.get("status") == "ok" and "data" in response:
-            return response["data"]
-        return {}
+        return self._response_data(response)
 
     async def set_device_active(self, active: bool) -> bool:
         """Turn device on/off."""
-        params = {"devicestate": {"deviceactive": active}}
-        response = await self._send_request("setDeviceParams", params)
-        return response.get("status") == "ok"
+        return await self.set_device_params({"devicestate": {"deviceactive": active}})
 
     async def set_fan_level(self, level: int) -> bool:
         """Set fan level (0-7)."""
         if not 0 <= level <= 7:
             raise ValueError("Fan level must be between 0 and 7")
             
-        params = {"fanlevel": level}
+        return await self.set_device_params({"fanlevel": level})
+
+    async def set_device_params(self, params: dict[str, Any]) -> bool:
+        """Write one or more device parameters in a single request."""
         response = await self._send_request("setDeviceParams", params)
         return response.get("status") == "ok"
 
@@ -179,62 +456,394 @@ class SiegeniaDevice:
         """Set callback for data updates."""
         self._data_callback = callback
 
+    @property
+    def rtt(self) -> RttEstimator:
+        """Return the round-trip time estimate of this connection."""
+        return self._rtt
+
+    @property
+    def metrics(self) -> DeviceMetrics:
+        """Return the protocol metrics of this device."""
+        return self._metrics
+
+    @property
+    def pending_requests(self) -> int:
+        """Return the number of requests waiting for a response."""
+        return len(self._awaiting_responses)
+
+    @property
+    def queued_requests(self) -> int:
+        """Return the number of requests waiting to be sent."""
+        return len(self._send_queue)
+
+    @property
+    def token(self) -> str | None:
+        """Return the long-life session token."""
+        return self._token
+
+    def set_token_callback(self, callback: Callable[[str | None], None]) -> None:
+        """Set callback for a new long-life session token."""
+        self._token_callback = callback
+
+    def set_connection_lost_callback(self, callback: Callable[[], None]) -> None:
+        """Set callback for an unexpected loss of the connection."""
+        self._connection_lost_callback = callback
+
+    def set_reconnected_callback(self, callback: Callable[[], None]) -> None:
+        """Set callback for a successful automatic reconnect."""
+        self._reconnected_callback = callback
+
+    def set_request_limits(
+        self,
+        max_in_flight: int = WS_MAX_IN_FLIGHT,
+        rate_limit: float = WS_RATE_LIMIT,
+        rate_burst: int = WS_RATE_BURST,
+        max_queue: int = WS_MAX_QUEUE,
+    ) -> None:
+        """Limit requests awaiting a response and the sustained request rate.
+
+        A rate limit of 0 sends as fast as the in-flight limit allows. At
+        most max_queue requests wait for a free slot, 0 lets them pile up.
+        """
+        self._max_in_flight = max(1, max_in_flight)
+        self._max_queue = max(0, max_queue)
+        self._bucket = TokenBucket(rate_limit, rate_burst)
+        self._queue_ready.set()
+
+    def set_connect_limiter(
+        self, limiter: Callable[[], AbstractAsyncContextManager]
+    ) -> None:
+        """Set a context manager factory that gates automatic reconnects."""
+        self._connect_limiter = limiter
+
     def _get_next_request_id(self) -> int:
         """Get next request ID."""
         self._request_id += 1
         return self._request_id
 
-    async def _send_request(self, command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Send a request to the device."""
+    async def send_batch(
+        self,
+        requests: list[tuple[str, dict[str, Any] | None]],
+        priority: RequestPriority | None = None,
+    ) -> list[dict[str, Any]]:
+        """Send several requests back to back and collect their responses.
+
+        Responses are matched by id, so the whole batch costs a single round
+        trip. Results are returned in request order. Without a priority each
+        request is queued with the priority of its command.
+        """
+        return await self._exchange(
+            [(command, params, None) for command, params in requests], priority
+        )
+
+    async def _exchange(
+        self,
+        requests: list[
+            tuple[str, dict[str, Any] | None, dict[str, Any] | None]
+        ],
+        priority: RequestPriority | None = None,
+    ) -> list[dict[str, Any]]:
+        """Queue (command, params, fields) requests and gather the responses.
+
+        Each request times out WS_TIMEOUT after it was sent; time spent in the
+        queue behind more important requests does not count.
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to device")
+
+        queued = [
+            self._enqueue(command, params, fields, priority)
+            for command, params, fields in requests
+        ]
+        try:
+            # A queued read may be shared with other callers, so cancelling
+            # this caller must not cancel the request itself
+            responses = await asyncio.gather(
+                *(asyncio.shield(request.future) for request in queued)
+            )
+            return list(responses)
+
+        except asyncio.CancelledError:
+            for request in queued:
+                self._abandon(request)
+            raise
+        except (asyncio.TimeoutError, RequestDropped):
+            # Logged and counted when the request expired or was dropped
+            raise
+        except Exception as err:
+            _LOGGER.error("Error sending request: %s", err)
+            raise
+
+    def _enqueue(
+        self,
+        command: str,
+        params: dict[str, Any] | None,
+        fields: dict[str, Any] | None,
+        priority: RequestPriority | None,
+    ) -> _Request:
+        """Put a request into the send queue.
+
+        A read that is identical to one queued or in flight joins it instead
+        of being sent twice, and a read answered less than READ_CACHE_TTL ago
+        is served from memory. Writes and pushes invalidate both, so a read
+        never returns data from before a change it could have seen.
+        """
+        if priority is None:
+            priority = COMMAND_PRIORITY.get(command, RequestPriority.READ)
+        loop = asyncio.get_running_loop()
+
+        key = None
+        if priority == RequestPriority.READ and not fields and self.coalesce_reads:
+            key = (command, self._codec.dumps(params) if params else "")
+            if (request := self._shared_reads.get(key)) is not None:
+                self._metrics.shared_reads += 1
+                request.waiters += 1
+                return request
+            if (cached := self._read_cache.get(key)) and cached[0] > loop.time():
+                self._metrics.cached_reads += 1
+                request = _Request(
+                    command, params, fields, priority, None,
+                    self._read_generation, loop.create_future(),
+                )
+                request.future.set_result(cached[1])
+                return request
+        elif priority == RequestPriority.WRITE:
+            self._invalidate_reads()
+
+        request = _Request(
+            command, params, fields, priority, key,
+            self._read_generation, loop.create_future(),
+        )
+        request.future.add_done_callback(partial(self._request_done, request))
+        if self._max_queue and self._backlog() >= self._max_queue:
+            self._make_room(request)
+            if request.future.done():
+                return request
+        if key:
+            self._shared_reads[key] = request
+        request.queued_at = loop.time()
+        heapq.heappush(self._send_queue, (priority, next(self._queue_seq), request))
+        self._queue_ready.set()
+        return request
+
+    def _backlog(self) -> int:
+        """Return how many queued requests cannot be sent right away."""
+        free = max(0, self._max_in_flight - len(self._awaiting_responses))
+        return max(0, len(self._send_queue) - free)
+
+    def _make_room(self, request: _Request) -> None:
+        """Drop the least important request to keep the backlog bounded.
+
+        That is the newest request of the lowest priority, which may be the
+        new one itself; older requests of a priority have waited longer.
+        Writes and logins are never dropped, they may exceed the bound.
+        """
+        # Abandoned requests still hold their place until the sender skips them
+        self._send_queue = [
+            entry for entry in self._send_queue if not entry[2].future.done()
+        ]
+        heapq.heapify(self._send_queue)
+        if self._backlog() < self._max_queue:
+            return
+
+        victim = max(self._send_queue, key=lambda entry: (entry[0], entry[1]))
+        if victim[0] > request.priority:
+            self._send_queue.remove(victim)
+            heapq.heapify(self._send_queue)
+            dropped = victim[2]
+        elif request.priority == RequestPriority.WRITE:
+            return
+        else:
+            dropped = request
+
+        self._metrics.dropped_requests += 1
+        _LOGGER.debug(
+            "Request queue of %s is full, dropping %s", self.host, dropped.command
+        )
+        dropped.future.set_exception(
+            RequestDropped(f"Request queue of {self.host} is full")
+        )
+
+    def _abandon(self, request: _Request) -> None:
+        """Drop a caller from a request, unqueueing it if nobody else waits."""
+        request.waiters -= 1
+        if request.waiters <= 0 and request.request_id is None:
+            # The sender skips settled requests
+            request.future.cancel()
+
+    def _invalidate_reads(self) -> None:
+        """Stop sharing and caching reads issued before a change."""
+        self._shared_reads.clear()
+        self._read_cache.clear()
+        self._read_generation += 1
+
+    async def _sender_loop(self) -> None:
+        """Send queued requests in priority order within the in-flight window."""
+        while True:
+            await self._queue_ready.wait()
+            self._queue_ready.clear()
+
+            while self._send_queue:
+                priority, _, request = self._send_queue[0]
+                if request.future.done():
+                    heapq.heappop(self._send_queue)
+                    continue
+
+                window = self._max_in_flight
+                if priority != RequestPriority.WRITE:
+                    window = max(1, window - WS_RESERVED_FOR_WRITES)
+                if len(self._awaiting_responses) >= window:
+                    # Woken up again when a response frees a slot
+                    break
+
+                loop = asyncio.get_running_loop()
+                if wait := self._bucket.delay(loop.time()):
+                    # Look at the queue again afterwards, a more important
+                    # request may have arrived in the meantime
+                    self._metrics.rate_limited += 1
+                    await asyncio.sleep(wait)
+                    continue
+
+                heapq.heappop(self._send_queue)
+                self._metrics.record_queue_wait(loop.time() - request.queued_at)
+                try:
+                    await self._dispatch_request(request)
+                except Exception as err:  # pylint: disable=broad-except
+                    if not request.future.done():
+                        request.future.set_exception(err)
+
+    async def get_device_snapshot(
+        self,
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """Get device state, parameters and information in one round trip.
+
+        Device information is only requested when the cache is stale.
+        """
+        requests: list[tuple[str, dict[str, Any] | None]] = [
+            ("getDeviceState", None),
+            ("getDeviceParams", None),
+        ]
+        fetch_info = self.device_info_stale
+        if fetch_info:
+            requests.append(("getDevice", None))
+
+        responses = await self.send_batch(requests)
+        if fetch_info and (device_info := self._response_data(responses[2])):
+            self._device_info = device_info
+            self._device_info_stale = False
+
+        return (
+            self._response_data(responses[0]),
+            self._response_data(responses[1]),
+            self._device_info,
+        )
+
+    @staticmethod
+    def _response_data(response: dict[str, Any]) -> dict[str, Any]:
+        """Return the data of a successful response."""
+        if response.get("status") == "ok" and "data" in response:
+            return response["data"]
+        return {}
+
+    async def _dispatch_request(self, request: _Request) -> None:
+        """Send a queued request without waiting for its response.
+
+        Fields are added at the top level of the request, next to command.
+        """
         if not self.is_connected:
             raise ConnectionError("Not connected to device")
 
         request_id = self._get_next_request_id()
-        request = {
-            "command": command,
+        message = {
+            "command": request.command,
             "id": request_id
         }
-        
-        if params:
-            request["params"] = params
 
-        # Create future for response
-        future = asyncio.Future()
-        self._awaiting_responses[request_id] = future
+        if request.fields:
+            message.update(request.fields)
+        if request.params:
+            message["params"] = request.params
+
+        payload = self._codec.dumps(message)
+        loop = asyncio.get_running_loop()
+        request.request_id = request_id
+        request.sent_at = loop.time()
+        request.timer = loop.call_later(WS_TIMEOUT, self._expire_request, request)
+        self._awaiting_responses[request_id] = request
 
         try:
-            # Send request
-            await self._websocket.send_str(json.dumps(request))
-            _LOGGER.debug("Sent request: %s", json.dumps(request))
-            
-            # Wait for response with timeout
-            response = await asyncio.wait_for(future, timeout=WS_TIMEOUT)
-            return response
-            
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout waiting for response to request %s", request_id)
-            if request_id in self._awaiting_responses:
-                del self._awaiting_responses[request_id]
-            raise
-        except Exception as err:
-            _LOGGER.error("Error sending request: %s", err)
-            if request_id in self._awaiting_responses:
-                del self._awaiting_responses[request_id]
+            await self._websocket.send_str(payload)
+        except Exception:
+            self._awaiting_responses.pop(request_id, None)
             raise
 
+        # Log the encoded payload, formatting only happens at DEBUG level;
+        # credentials are kept out of the log
+        if request.command == "login":
+            _LOGGER.debug("Sent login request %s", request_id)
+        else:
+            _LOGGER.debug("Sent request: %s", payload)
+
+    def _expire_request(self, request: _Request) -> None:
+        """Fail a request that got no response in time."""
+        if request.future.done():
+            return
+        _LOGGER.error(
+            "Timeout waiting for response to request %s (%s)",
+            request.request_id, request.command,
+        )
+        self._metrics.command(request.command).timeouts += 1
+        request.future.set_exception(asyncio.TimeoutError())
+
+    def _request_done(self, request: _Request, future: asyncio.Future) -> None:
+        """Free the slot of a settled request and record its latency."""
+        if request.timer:
+            request.timer.cancel()
+        if request.key and self._shared_reads.get(request.key) is request:
+            del self._shared_reads[request.key]
+        if request.request_id is not None:
+            self._awaiting_responses.pop(request.request_id, None)
+        self._queue_ready.set()
+
+        if request.sent_at is None or future.cancelled():
+            # Abandoned or failed before it was sent
+            return
+        metrics = self._metrics.command(request.command)
+        if (err := future.exception()) is None:
+            now = asyncio.get_running_loop().time()
+            metrics.record(now - request.sent_at)
+            self._rtt.add(now - request.sent_at)
+            if request.key and request.generation == self._read_generation:
+                self._read_cache[request.key] = (now + READ_CACHE_TTL, future.result())
+        elif not isinstance(err, asyncio.TimeoutError):
+            metrics.errors += 1
+
+    async def _send_request(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+        fields: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request to the device."""
+        return (await self._exchange([(command, params, fields)]))[0]
+
     async def _listen_for_messages(self) -> None:
         """Listen for incoming WebSocket messages."""
+        websocket = self._websocket
         try:
-            async for msg in self._websocket:
+            async for msg in websocket:
                 if msg.type == aiohttp.WSMsgType.TEXT:
+                    self._last_activity = asyncio.get_running_loop().time()
                     try:
-                        data = json.loads(msg.data)
-                        _LOGGER.debug("Received message: %s", json.dumps(data))
-                        await self._handle_message(data)
-                    except json.JSONDecodeError as err:
+                        data = self._codec.loads(msg.data)
+                    except ValueError as err:
                         _LOGGER.error("Failed to decode message: %s - Raw: %s", err, msg.data)
+                        continue
+                    # Log the raw frame instead of re-encoding the message
+                    _LOGGER.debug("Received message: %s", msg.data)
+                    await self._handle_message(data)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
-                    _LOGGER.error("WebSocket error: %s", self._websocket.exception())
+                    _LOGGER.error("WebSocket error: %s", websocket.exception())
                     break
                 elif msg.type == aiohttp.WSMsgType.CLOSE:
                     _LOGGER.info("WebSocket connection closed")
@@ -242,28 +851,140 @@ class SiegeniaDevice:
         except Exception as err:
             _LOGGER.error("Error in message listener: %s", err)
 
+        # Only a drop of the current connection counts; a socket we closed
+        # ourselves has already been detached
+        if not self._closing and self._websocket is websocket:
+            await self._handle_connection_lost()
+
+    async def _handle_connection_lost(self) -> None:
+        """Tear down a dropped connection and start the reconnect supervisor."""
+        _LOGGER.warning("Connection to %s:%s lost", self.host, self.port)
+        self._metrics.connection_losses += 1
+        await self._close_connection()
+
+        if self.auto_reconnect and not self.is_reconnecting:
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+        if self._connection_lost_callback:
+            self._connection_lost_callback()
+
+    async def _reconnect_loop(self) -> None:
+        """Reconnect and log in again with exponential backoff and jitter."""
+        delay = RECONNECT_MIN_DELAY
+        # Spread the first attempt so a fleet does not reconnect in lockstep
+        wait = random.uniform(0, RECONNECT_MIN_DELAY)
+
+        while not self._closing:
+            await asyncio.sleep(wait)
+            try:
+                if await self._reconnect_once():
+                    break
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Reconnect to %s failed: %s", self.host, err)
+
+            # Equal jitter: wait between half and the full backoff delay
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            wait = delay / 2 + random.uniform(0, delay / 2)
+            _LOGGER.debug("Retrying connection to %s in %.1f s", self.host, wait)
+        else:
+            return
+
+        _LOGGER.info("Reconnected to Siegenia device at %s:%s", self.host, self.port)
+        self._metrics.reconnects += 1
+        self._reconnect_task = None
+        if self._reconnected_callback:
+            self._reconnected_callback()
+
     async def _handle_message(self, data: dict[str, Any]) -> None:
         """Handle incoming WebSocket message."""
         message_id = data.get("id")
         
         # Handle response to our request
         if message_id and message_id in self._awaiting_responses:
-            future = self._awaiting_responses.pop(message_id)
-            if not future.done():
-                future.set_result(data)
+            request = self._awaiting_responses.pop(message_id)
+            if not request.future.done():
+                request.future.set_result(data)
         # Handle unsolicited data updates
-        elif data.get("command") == "deviceParams" and self._data_callback:
-            self._data_callback(data.get("data", {}))
+        elif data.get("command") == "deviceParams":
+            self._metrics.record_push()
+            self._invalidate_reads()
+            params = data.get("data", {})
+            self._check_firmware_change(params)
+            if self._data_callback:
+                self._data_callback(params)
+
+    def _check_firmware_change(self, params: dict[str, Any]) -> None:
+        """Invalidate cached device information after a firmware change."""
+        for key in ("softwareversion", "hardwareversion"):
+            if key in params and params[key] != self._device_info.get(key):
+                _LOGGER.debug("%s of %s changed to %s", key, self.host, params[key])
+                self._device_info_stale = True
+
+    async def _reconnect_once(self) -> bool:
+        """Connect and log in, inside the connect limiter if one is set."""
+        if self._connect_limiter is None:
+            return await self._connect_and_login()
+        async with self._connect_limiter():
+            return await self._connect_and_login()
+
+    async def _connect_and_login(self) -> bool:
+        """Connect and log in, closing the socket again if login fails."""
+        await self.connect()
+        try:
+            if await self.login():
+                return True
+        except BaseException:
+            await self._close_connection()
+            raise
+        await self._close_connection()
+        return False
 
     async def _heartbeat_loop(self) -> None:
-        """Send periodic heartbeat to keep connection alive."""
+        """Keep the session alive and watch the health of the connection.
+
+        A keepAlive is only sent after WS_HEARTBEAT_INTERVAL without any
+        received frame, since responses and pushes already prove the link
+        works; requests sent into a half-open link prove nothing.
+        Repeated keepAlive failures or a consistently slow round trip hand
+        the connection over to the reconnect path.
+        """
+        loop = asyncio.get_running_loop()
+        failures = 0
+        slow = 0
+
         while self.is_connected:
+            idle = loop.time() - self._last_activity
+            if idle < WS_HEARTBEAT_INTERVAL and not failures:
+                await asyncio.sleep(WS_HEARTBEAT_INTERVAL - idle)
+                continue
+
             try:
-                await asyncio.sleep(WS_HEARTBEAT_INTERVAL)
-                if self.is_connected:
-                    await self._send_request("keepAlive", {"extend_session": True})
+                await self._send_request("keepAlive", {"extend_session": True})
             except asyncio.CancelledError:
-                break
-            except Exception as err:
-                _LOGGER.error("Heartbeat error: %s", err)
-                break
\ No newline at end of file
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                failures += 1
+                _LOGGER.warning(
+                    "Heartbeat to %s failed (%d/%d): %s",
+                    self.host, failures, KEEPALIVE_MAX_FAILURES, err,
+                )
+                if failures >= KEEPALIVE_MAX_FAILURES:
+                    break
+                # Retry sooner than the regular interval
+                await asyncio.sleep(WS_HEARTBEAT_INTERVAL / 3)
+                continue
+
+            failures = 0
+            if self._rtt.last is not None and self._rtt.last > KEEPALIVE_DEGRADED_RTT:
+                slow += 1
+                _LOGGER.debug("Slow heartbeat from %s: %.2f s", self.host, self._rtt.last)
+                if slow >= KEEPALIVE_DEGRADED_COUNT:
+                    break
+            else:
+                slow = 0
+        else:
+            return
+
+        if self.is_connected and not self._closing:
+            _LOGGER.warning("Connection to %s degraded, reconnecting", self.host)
+            await self._handle_connection_lost()
@@ -0,0 +1,43 @@
+"""Diagnostics support for Siegenia."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .scheduler import async_get_scheduler
+
+TO_REDACT = {CONF_PASSWORD, "token", "serialnr"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    device = coordinator.device
+
+    return {
+        "entry": async_redact_data(
+            {"data": dict(entry.data), "options": dict(entry.options)}, TO_REDACT
+        ),
+        "device_info": async_redact_data(device.device_info, TO_REDACT),
+        "data": async_redact_data(
+            coordinator.data.as_dict() if coordinator.data else {}, TO_REDACT
+        ),
+        "connection": {
+            "connected": device.is_connected,
+            "reconnecting": device.is_reconnecting,
+            "push_active": coordinator.push_active,
+            "pending_requests": device.pending_requests,
+            "queued_requests": device.queued_requests,
+            "round_trip": device.rtt.as_dict(),
+        },
+        "metrics": device.metrics.as_dict(),
+        "history": coordinator.history.as_dict(),
+        "fleet": async_get_scheduler(hass).stats,
+    }
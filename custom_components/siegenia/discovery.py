@@ -0,0 +1,143 @@
+"""Discovery of Siegenia devices on the local network."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import ipaddress
+import logging
+from typing import Any
+
+import aiohttp
+from aiohttp import ClientSession
+
+from .const import (
+    DEFAULT_PORT,
+    DEVICE_TYPE_MAP,
+    DISCOVERY_MAX_CONCURRENT,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+)
+from .device import DEFAULT_CODEC, NO_VERIFY_SSL_CONTEXT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DiscoveredDevice:
+    """A device that answered getDevice during a scan."""
+
+    host: str
+    port: int
+    use_ssl: bool
+    name: str
+    model: str
+    serial_number: str | None = None
+    info: dict[str, Any] = field(default_factory=dict)
+
+
+def parse_hosts(network: str) -> list[str]:
+    """Return the addresses of a subnet, an address range or a single address.
+
+    Accepted are "192.168.1.0/24", "192.168.1.10-192.168.1.50",
+    "192.168.1.10-50" and "192.168.1.10". Raises ValueError for anything
+    else or for more than DISCOVERY_MAX_HOSTS addresses.
+    """
+    network = network.strip()
+    if "-" in network:
+        first, last = (part.strip() for part in network.split("-", 1))
+        start = ipaddress.IPv4Address(first)
+        if "." not in last:
+            # Short form, only the last octet of the end address
+            last = f"{first.rsplit('.', 1)[0]}.{last}"
+        end = ipaddress.IPv4Address(last)
+        if end < start:
+            raise ValueError(f"Empty address range {network}")
+        count = int(end) - int(start) + 1
+        if count > DISCOVERY_MAX_HOSTS:
+            raise ValueError(f"{network} has more than {DISCOVERY_MAX_HOSTS} addresses")
+        return [str(start + offset) for offset in range(count)]
+
+    subnet = ipaddress.IPv4Network(network, strict=False)
+    if subnet.num_addresses > DISCOVERY_MAX_HOSTS:
+        raise ValueError(f"{network} has more than {DISCOVERY_MAX_HOSTS} addresses")
+    if subnet.num_addresses == 1:
+        return [str(subnet.network_address)]
+    return [str(host) for host in subnet.hosts()]
+
+
+async def async_probe(
+    session: ClientSession,
+    host: str,
+    port: int = DEFAULT_PORT,
+    use_ssl: bool = True,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> DiscoveredDevice | None:
+    """Ask one address for its device information, None if nothing answers.
+
+    getDevice works without a login, so the probe needs no credentials.
+    Anything that is not a Siegenia WebSocket endpoint is skipped quietly.
+    """
+    protocol = "wss" if use_ssl else "ws"
+    info: dict[str, Any] | None = None
+    try:
+        async with asyncio.timeout(timeout):
+            async with session.ws_connect(
+                f"{protocol}://{host}:{port}/WebSocket",
+                ssl=NO_VERIFY_SSL_CONTEXT if use_ssl else None,
+                origin=f"{protocol}://{host}:{port}",
+                headers={"User-Agent": "Home Assistant Siegenia Integration"},
+            ) as websocket:
+                await websocket.send_str(
+                    DEFAULT_CODEC.dumps({"command": "getDevice", "id": 1})
+                )
+                async for msg in websocket:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    response = DEFAULT_CODEC.loads(msg.data)
+                    if isinstance(response, dict) and response.get("id") == 1:
+                        if response.get("status") == "ok" and isinstance(
+                            response.get("data"), dict
+                        ):
+                            info = response["data"]
+                        break
+    except (aiohttp.ClientError, OSError, TimeoutError, ValueError):
+        return None
+
+    if info is None:
+        return None
+
+    _LOGGER.debug("Found Siegenia device at %s:%s: %s", host, port, info)
+    return DiscoveredDevice(
+        host=host,
+        port=port,
+        use_ssl=use_ssl,
+        name=info.get("devicename") or "Siegenia Device",
+        model=DEVICE_TYPE_MAP.get(info.get("type"), "Unknown"),
+        serial_number=info.get("serialnr"),
+        info=info,
+    )
+
+
+async def async_discover(
+    session: ClientSession,
+    hosts: list[str],
+    port: int = DEFAULT_PORT,
+    use_ssl: bool = True,
+    max_concurrent: int = DISCOVERY_MAX_CONCURRENT,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> list[DiscoveredDevice]:
+    """Probe all hosts concurrently and return the devices found.
+
+    At most max_concurrent probes run at once and each gives up after
+    timeout seconds, so a /24 is scanned in a few seconds.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def probe(host: str) -> DiscoveredDevice | None:
+        async with semaphore:
+            return await async_probe(session, host, port, use_ssl, timeout)
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    devices = [device for device in results if device is not None]
+    _LOGGER.debug("Scanned %d addresses, found %d devices", len(hosts), len(devices))
+    return devices
\ No newline at end of file
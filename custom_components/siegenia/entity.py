@@ -0,0 +1,43 @@
+"""Base entity for the Siegenia integration."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import SiegeniaDataUpdateCoordinator
+from .index import async_get_index
+
+
+class SiegeniaEntity(CoordinatorEntity):
+    """Base class for Siegenia entities."""
+
+    _attr_has_entity_name = True
+
+    # Data keys the entity renders; None subscribes to every update
+    _watched_keys: frozenset[str] | None = None
+
+    coordinator: SiegeniaDataUpdateCoordinator
+
+    def __init__(
+        self,
+        coordinator: SiegeniaDataUpdateCoordinator,
+        entry: ConfigEntry
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, self._watched_keys)
+        self._entry = entry
+
+    async def async_added_to_hass(self) -> None:
+        """Register the entity with the service index."""
+        await super().async_added_to_hass()
+        index = async_get_index(self.hass)
+        entity_id = self.entity_id
+        device_id = self.registry_entry.device_id if self.registry_entry else None
+        index.async_add(entity_id, device_id, self.coordinator)
+        self.async_on_remove(lambda: index.async_remove(entity_id, device_id))
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information from the coordinator's metadata cache."""
+        return self.coordinator.device_info
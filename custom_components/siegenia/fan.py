@@ -8,7 +8,6 @@ from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.percentage import (
     ordered_list_item_to_percentage,
     percentage_to_ordered_list_item,
@@ -16,6 +15,7 @@ from homeassistant.util.percentage import (
 
 from .const import AEROPAC_FAN_LEVELS, DOMAIN
 from .coordinator import SiegeniaDataUpdateCoordinator
+from .entity import SiegeniaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,20 +32,20 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
     # Only add fan entity if we have device info
-    if coordinator.data and coordinator.data.get("device_info"):
+    if coordinator.data and coordinator.data.device_info:
         async_add_entities([SiegeniaFan(coordinator, entry)])
 
 
-class SiegeniaFan(CoordinatorEntity, FanEntity):
+class SiegeniaFan(SiegeniaEntity, FanEntity):
     """Representation of a Siegenia fan."""
 
-    _attr_has_entity_name = True
     _attr_supported_features = (
         FanEntityFeature.SET_SPEED | 
         FanEntityFeature.TURN_ON | 
         FanEntityFeature.TURN_OFF
     )
     _attr_speed_count = 7  # Level 1-7
+    _watched_keys = frozenset({"fanlevel", "deviceactive", "timer", "warnings"})
 
     def __init__(
         self, 
@@ -53,25 +53,10 @@ class SiegeniaFan(CoordinatorEntity, FanEntity):
         entry: ConfigEntry
     ) -> None:
         """Initialize the fan."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry)
         
-        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_fan"
         
-        # Set device info
-        device_info = coordinator.data.get("device_info", {})
-        device_name = device_info.get("devicename", "Siegenia Device")
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": device_name,
-            "manufacturer": "Siegenia",
-            "model": device_info.get("type", "Unknown"),
-            "sw_version": device_info.get("softwareversion"),
-            "hw_version": device_info.get("hardwareversion"),
-            "serial_number": device_info.get("serialnr"),
-        }
-        
         self._attr_name = None  # Use device name
 
     @property
@@ -79,27 +64,18 @@ class SiegeniaFan(CoordinatorEntity, FanEntity):
         """Return true if fan is on."""
         if not self.coordinator.data:
             return False
-            
-        # Check if device is active and fan level > 0
-        device_active = self.coordinator.data.get("deviceactive", False)
-        fan_level = self.coordinator.data.get("fanlevel", 0)
-        
-        return device_active and fan_level > 0
+
+        # Device is active and fan level > 0
+        return self.coordinator.data.is_on
 
     @property
     def percentage(self) -> int:
         """Return the current speed as percentage (mapped from fan levels 1-7)."""
         if not self.coordinator.data:
             return 0
-            
-        fan_level = self.coordinator.data.get("fanlevel", 0)
-        
-        if fan_level == 0:
-            return 0
-        
-        # Map fan levels 1-7 to percentage 1-100
+
         # Level 1 = ~14%, Level 7 = 100%
-        return int((fan_level / 7) * 100)
+        return self.coordinator.data.percentage
 
     @property
     def speed_count(self) -> int:
@@ -123,11 +99,8 @@ class SiegeniaFan(CoordinatorEntity, FanEntity):
                 
             _LOGGER.debug("Turning on fan with level %s (from percentage %s)", fan_level, percentage)
             
-            # Make sure device is turned on
-            await self.coordinator.async_set_device_active(True)
-            
-            # Set Fan Level
-            await self.coordinator.async_set_fan_level(fan_level)
+            # Turn device on and set fan level in one write
+            await self.coordinator.async_set_state(active=True, fan_level=fan_level)
             
         except Exception as err:
             _LOGGER.error("Error turning on fan: %s", err)
@@ -136,10 +109,8 @@ class SiegeniaFan(CoordinatorEntity, FanEntity):
         """Turn off the fan."""
         try:
             _LOGGER.debug("Turning off fan (setting level to 0)")
-            # Turn Device Off = Level 0
-            await self.coordinator.async_set_fan_level(0)
-            # Turn Device Off
-            await self.coordinator.async_set_device_active(False)
+            # Turn Device Off = Level 0 and inactive, in one write
+            await self.coordinator.async_set_state(active=False, fan_level=0)
         except Exception as err:
             _LOGGER.error("Error turning off fan: %s", err)
 
@@ -159,34 +130,24 @@ class SiegeniaFan(CoordinatorEntity, FanEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if not self.coordinator.data:
+        state = self.coordinator.data
+        if not state:
             return {}
-            
-        attributes = {}
-        
-        # Add current fan level
-        fan_level = self.coordinator.data.get("fanlevel", 0)
-        attributes["fan_level"] = fan_level
-        attributes["fan_level_name"] = AEROPAC_FAN_LEVELS.get(fan_level, "Unknown")
-        
-        # Add device active state
-        attributes["device_active"] = self.coordinator.data.get("deviceactive", False)
-        
+
+        attributes = {
+            "fan_level": state.fan_level,
+            "fan_level_name": state.level_name,
+            "device_active": state.active,
+        }
+
         # Add timer information if available
-        if "timer" in self.coordinator.data:
-            timer_data = self.coordinator.data["timer"]
-            if isinstance(timer_data, dict):
-                if "remainingtime" in timer_data:
-                    remaining = timer_data["remainingtime"]
-                    if isinstance(remaining, dict) and "hour" in remaining and "minute" in remaining:
-                        attributes["timer_remaining"] = f"{remaining['hour']:02d}:{remaining['minute']:02d}"
-                        
-                if "enabled" in timer_data:
-                    attributes["timer_enabled"] = timer_data["enabled"]
-        
+        if state.timer_remaining is not None:
+            attributes["timer_remaining"] = state.timer_remaining
+        if state.timer_enabled is not None:
+            attributes["timer_enabled"] = state.timer_enabled
+
         # Add warnings if any
-        warnings = self.coordinator.data.get("warnings", [])
-        if warnings:
-            attributes["warnings"] = warnings
-            
+        if state.warnings:
+            attributes["warnings"] = state.warnings
+
         return attributes
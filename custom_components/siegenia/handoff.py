@@ -0,0 +1,79 @@
+"""Handoff of validated device connections from the config flow."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import logging
+from typing import Any
+
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CONF_USE_SSL, DATA_HANDOFF, HANDOFF_TIMEOUT
+from .device import SiegeniaDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _connection_key(data: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Return everything that has to match for a connection to be reused."""
+    return (
+        data[CONF_HOST],
+        data[CONF_PORT],
+        data[CONF_USERNAME],
+        data[CONF_PASSWORD],
+        data[CONF_USE_SSL],
+    )
+
+
+class SiegeniaDeviceHandoff:
+    """Logged in devices the config flow validated, waiting for their entry.
+
+    The flow parks the connection it just authenticated here instead of
+    closing it, and the coordinator of the new config entry adopts it, so
+    adding a device costs a single connect and login. A device nobody
+    adopts within HANDOFF_TIMEOUT seconds is disconnected.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the handoff."""
+        self._hass = hass
+        self._parked: dict[tuple[Any, ...], tuple[SiegeniaDevice, CALLBACK_TYPE]] = {}
+
+    @callback
+    def async_park(self, data: Mapping[str, Any], device: SiegeniaDevice) -> None:
+        """Keep a validated device for the config entry created from data."""
+        key = _connection_key(data)
+        self._async_release(key)
+
+        @callback
+        def _expire(_now: Any) -> None:
+            _LOGGER.debug("Nobody adopted the connection to %s, closing it", device.host)
+            self._parked.pop(key, None)
+            self._hass.async_create_task(device.disconnect())
+
+        self._parked[key] = (device, async_call_later(self._hass, HANDOFF_TIMEOUT, _expire))
+
+    @callback
+    def async_adopt(self, data: Mapping[str, Any]) -> SiegeniaDevice | None:
+        """Take over the parked device for data, None if there is none."""
+        if (parked := self._parked.pop(_connection_key(data), None)) is None:
+            return None
+        device, cancel_expiry = parked
+        cancel_expiry()
+        return device
+
+    @callback
+    def _async_release(self, key: tuple[Any, ...]) -> None:
+        """Disconnect a device parked under key."""
+        if (parked := self._parked.pop(key, None)) is not None:
+            device, cancel_expiry = parked
+            cancel_expiry()
+            self._hass.async_create_task(device.disconnect())
+
+
+def async_get_handoff(hass: HomeAssistant) -> SiegeniaDeviceHandoff:
+    """Return the integration-wide handoff, creating it on first use."""
+    if (handoff := hass.data.get(DATA_HANDOFF)) is None:
+        handoff = hass.data[DATA_HANDOFF] = SiegeniaDeviceHandoff(hass)
+    return handoff
\ No newline at end of file
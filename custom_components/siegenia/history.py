@@ -0,0 +1,132 @@
+"""Short-term in-memory state history of Siegenia devices."""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timezone
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .model import SiegeniaState
+
+# Marks a disabled timer or a value the device did not report
+UNKNOWN = -1
+
+
+def _state_values(state: SiegeniaState) -> tuple[int, int, int, int]:
+    """Return fan level, active flag, timer minutes and warning count."""
+    timer = state.timer_minutes if state.timer_enabled else None
+    return (
+        state.fan_level,
+        int(state.active),
+        UNKNOWN if timer is None else timer,
+        len(state.warnings),
+    )
+
+
+class StateHistory:
+    """Fixed-size ring buffer of timestamped state changes.
+
+    Each column is a typed array allocated once, so a device costs about
+    14 bytes per entry no matter how often it pushes. Only changes of the
+    tracked values are recorded; once full, the oldest entry is overwritten.
+    """
+
+    __slots__ = (
+        "size", "_timestamps", "_fan_level", "_active", "_timer", "_warnings",
+        "_next", "_count",
+    )
+
+    def __init__(self, size: int) -> None:
+        """Initialize the buffer."""
+        self.size = size
+        self._timestamps = array("d", [0.0]) * size
+        self._fan_level = array("b", [UNKNOWN]) * size
+        self._active = array("b", [UNKNOWN]) * size
+        self._timer = array("h", [UNKNOWN]) * size
+        self._warnings = array("h", [UNKNOWN]) * size
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of recorded entries."""
+        return self._count
+
+    def record(self, state: SiegeniaState, timestamp: float | None = None) -> bool:
+        """Record the state if it differs from the last entry."""
+        values = _state_values(state)
+        if self._count:
+            last = (self._next - 1) % self.size
+            if values == (
+                self._fan_level[last],
+                self._active[last],
+                self._timer[last],
+                self._warnings[last],
+            ):
+                return False
+
+        index = self._next
+        self._timestamps[index] = time.time() if timestamp is None else timestamp
+        (
+            self._fan_level[index],
+            self._active[index],
+            self._timer[index],
+            self._warnings[index],
+        ) = values
+        self._next = (index + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+        return True
+
+    def query(
+        self, since: float | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Return entries oldest first.
+
+        Since drops entries recorded before that timestamp, limit keeps only
+        the newest entries.
+        """
+        start = (self._next - self._count) % self.size
+        entries = []
+        for offset in range(self._count):
+            index = (start + offset) % self.size
+            timestamp = self._timestamps[index]
+            if since is not None and timestamp < since:
+                continue
+            entries.append(
+                {
+                    "time": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+                    "fan_level": self._value(self._fan_level[index]),
+                    "device_active": (
+                        None if self._active[index] == UNKNOWN else bool(self._active[index])
+                    ),
+                    "timer_minutes": self._value(self._timer[index]),
+                    "warnings": self._value(self._warnings[index]),
+                }
+            )
+        if limit:
+            entries = entries[-limit:]
+        return entries
+
+    @staticmethod
+    def _value(value: int) -> int | None:
+        """Return a stored value, None if it was not reported."""
+        return None if value == UNKNOWN else value
+
+    @property
+    def memory(self) -> int:
+        """Return the bytes allocated for the entries."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self._timestamps, self._fan_level, self._active, self._timer, self._warnings
+            )
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all entries with the buffer size."""
+        return {
+            "size": self.size,
+            "count": self._count,
+            "memory_bytes": self.memory,
+            "entries": self.query(),
+        }
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""Index from entities and devices to their Siegenia coordinator."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_INDEX
+
+if TYPE_CHECKING:
+    from .coordinator import SiegeniaDataUpdateCoordinator
+
+
+class SiegeniaCoordinatorIndex:
+    """Map entity and device ids to the coordinator that owns them.
+
+    Entities add themselves when they are added to Home Assistant and remove
+    themselves again, so services resolve their targets with dictionary
+    lookups instead of walking the entity registry and every config entry.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._entities: dict[str, SiegeniaDataUpdateCoordinator] = {}
+        self._devices: dict[str, SiegeniaDataUpdateCoordinator] = {}
+        self._device_refs: dict[str, int] = {}
+
+    @callback
+    def async_add(
+        self,
+        entity_id: str,
+        device_id: str | None,
+        coordinator: SiegeniaDataUpdateCoordinator,
+    ) -> None:
+        """Index an entity and its device."""
+        self._entities[entity_id] = coordinator
+        if device_id:
+            self._devices[device_id] = coordinator
+            self._device_refs[device_id] = self._device_refs.get(device_id, 0) + 1
+
+    @callback
+    def async_remove(self, entity_id: str, device_id: str | None) -> None:
+        """Drop an entity, and its device once no entity refers to it."""
+        self._entities.pop(entity_id, None)
+        if device_id and device_id in self._device_refs:
+            self._device_refs[device_id] -= 1
+            if not self._device_refs[device_id]:
+                del self._device_refs[device_id]
+                del self._devices[device_id]
+
+    @callback
+    def async_resolve(
+        self, entity_ids: Iterable[str], device_ids: Iterable[str] = ()
+    ) -> dict[str, SiegeniaDataUpdateCoordinator]:
+        """Return the coordinators of the given targets, keyed by config entry.
+
+        Ids that do not belong to this integration are ignored.
+        """
+        coordinators: dict[str, SiegeniaDataUpdateCoordinator] = {}
+        for entity_id in entity_ids:
+            if coordinator := self._entities.get(entity_id):
+                coordinators[coordinator.entry.entry_id] = coordinator
+        for device_id in device_ids:
+            if coordinator := self._devices.get(device_id):
+                coordinators[coordinator.entry.entry_id] = coordinator
+        return coordinators
+
+    @callback
+    def async_device_id(self, coordinator: SiegeniaDataUpdateCoordinator) -> str | None:
+        """Return the device id of a coordinator if one of its entities is indexed."""
+        for device_id, indexed in self._devices.items():
+            if indexed is coordinator:
+                return device_id
+        return None
+
+
+def async_get_index(hass: HomeAssistant) -> SiegeniaCoordinatorIndex:
+    """Return the integration-wide index, creating it on first use."""
+    if (index := hass.data.get(DATA_INDEX)) is None:
+        index = hass.data[DATA_INDEX] = SiegeniaCoordinatorIndex()
+    return index
\ No newline at end of file
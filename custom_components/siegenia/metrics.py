@@ -0,0 +1,177 @@
+"""Protocol instrumentation for Siegenia devices."""
+from __future__ import annotations
+
+from bisect import bisect_left
+import time
+from typing import Any
+
+# Upper bounds of the latency histogram buckets in seconds; the last bucket
+# collects everything slower
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Length of the push rate window in seconds
+PUSH_RATE_WINDOW = 60.0
+
+
+class LatencyHistogram:
+    """Count, total, maximum and histogram of durations."""
+
+    __slots__ = ("count", "latency_total", "latency_max", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.count = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, latency: float) -> None:
+        """Record a duration in seconds."""
+        self.count += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Estimate a latency percentile from the histogram, in seconds."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.latency_max
+        return self.latency_max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with latencies in milliseconds."""
+        p50 = self.percentile(0.5)
+        p99 = self.percentile(0.99)
+        return {
+            "count": self.count,
+            "latency_avg_ms": self.latency_total / self.count * 1000 if self.count else None,
+            "latency_p50_ms": p50 * 1000 if p50 is not None else None,
+            "latency_p99_ms": p99 * 1000 if p99 is not None else None,
+            "latency_max_ms": self.latency_max * 1000,
+            "histogram": {
+                **{f"le_{bound * 1000:g}ms": count for bound, count in zip(LATENCY_BUCKETS, self.buckets)},
+                "slower": self.buckets[-1],
+            },
+        }
+
+
+class CommandMetrics(LatencyHistogram):
+    """Counters and latency histogram of one command."""
+
+    __slots__ = ("errors", "timeouts")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        super().__init__()
+        self.errors = 0
+        self.timeouts = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics with latencies in milliseconds."""
+        return {**super().as_dict(), "errors": self.errors, "timeouts": self.timeouts}
+
+
+class DeviceMetrics:
+    """Protocol counters of one device connection."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.commands: dict[str, CommandMetrics] = {}
+        self.connects = 0
+        self.reconnects = 0
+        self.connection_losses = 0
+        self.pushes = 0
+        # Reads answered by a request of another caller or from the cache
+        self.shared_reads = 0
+        self.cached_reads = 0
+        # Time requests spent in the send queue, sends held back by the
+        # rate limit and requests dropped from a full queue
+        self.queue_wait = LatencyHistogram()
+        self.rate_limited = 0
+        self.dropped_requests = 0
+        self.last_push: float | None = None
+        self._last_push_monotonic: float | None = None
+        # Sliding window push counter: current and previous window
+        self._push_window = 0
+        self._push_current = 0
+        self._push_previous = 0
+
+    def command(self, command: str) -> CommandMetrics:
+        """Return the metrics of a command."""
+        if (metrics := self.commands.get(command)) is None:
+            metrics = self.commands[command] = CommandMetrics()
+        return metrics
+
+    @property
+    def timeouts(self) -> int:
+        """Return the number of timed out requests of all commands."""
+        return sum(metrics.timeouts for metrics in self.commands.values())
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed requests of all commands."""
+        return sum(metrics.errors for metrics in self.commands.values())
+
+    def record_queue_wait(self, wait: float) -> None:
+        """Record how long a request waited before it was sent."""
+        self.queue_wait.record(wait)
+
+    def record_push(self) -> None:
+        """Record an unsolicited push."""
+        now = time.monotonic()
+        self._roll_push_window(now)
+        self._push_current += 1
+        self._last_push_monotonic = now
+        self.last_push = time.time()
+        self.pushes += 1
+
+    def _roll_push_window(self, now: float) -> None:
+        """Move the push counters forward to the window containing now."""
+        window = int(now // PUSH_RATE_WINDOW)
+        if window != self._push_window:
+            self._push_previous = (
+                self._push_current if window == self._push_window + 1 else 0
+            )
+            self._push_current = 0
+            self._push_window = window
+
+    @property
+    def push_rate(self) -> float:
+        """Return pushes per minute over a sliding window."""
+        now = time.monotonic()
+        self._roll_push_window(now)
+        elapsed = (now % PUSH_RATE_WINDOW) / PUSH_RATE_WINDOW
+        pushes = self._push_previous * (1 - elapsed) + self._push_current
+        return pushes * 60 / PUSH_RATE_WINDOW
+
+    @property
+    def seconds_since_last_push(self) -> float | None:
+        """Return the time since the last push."""
+        if self._last_push_monotonic is None:
+            return None
+        return time.monotonic() - self._last_push_monotonic
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics."""
+        return {
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "connection_losses": self.connection_losses,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "pushes": self.pushes,
+            "shared_reads": self.shared_reads,
+            "cached_reads": self.cached_reads,
+            "queue_wait": self.queue_wait.as_dict(),
+            "rate_limited": self.rate_limited,
+            "dropped_requests": self.dropped_requests,
+            "push_rate_per_minute": self.push_rate,
+            "seconds_since_last_push": self.seconds_since_last_push,
+            "commands": {command: metrics.as_dict() for command, metrics in self.commands.items()},
+        }
@@ -0,0 +1,105 @@
+"""Parsed state of a Siegenia device."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import AEROPAC_FAN_LEVELS
+
+_MISSING = object()
+
+
+class SiegeniaState:
+    """State of one device, parsed once per change.
+
+    The raw getDeviceState and getDeviceParams data is kept in a single dict
+    that updates and pushes are merged into in place. Only the keys that
+    actually changed are parsed again, and everything the entities show is
+    computed right there, so entity properties are plain attribute reads.
+    """
+
+    __slots__ = (
+        "raw", "device_info", "fan_level", "active", "is_on", "percentage",
+        "level_name", "timer_enabled", "timer_minutes", "timer_remaining", "warnings",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        self.raw: dict[str, Any] = {}
+        self.device_info: dict[str, Any] = {}
+        self.fan_level = 0
+        self.active = False
+        self.is_on = False
+        self.percentage = 0
+        self.level_name = AEROPAC_FAN_LEVELS[0]
+        self.timer_enabled: bool | None = None
+        self.timer_minutes: int | None = None
+        self.timer_remaining: str | None = None
+        self.warnings: list[Any] = []
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SiegeniaState:
+        """Create a state from a snapshot written by as_dict."""
+        state = cls()
+        state.device_info = data.get("device_info") or {}
+        state.apply({key: value for key, value in data.items() if key != "device_info"})
+        return state
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the raw data with the device information."""
+        return {**self.raw, "device_info": self.device_info}
+
+    def apply(self, data: dict[str, Any]) -> set[str]:
+        """Merge a response or push and return the keys that changed.
+
+        A change of devicestate that switches the device on or off is also
+        reported as deviceactive, the key entities watch for it.
+        """
+        raw = self.raw
+        changed = {
+            key for key, value in data.items() if raw.get(key, _MISSING) != value
+        }
+        if not changed:
+            return changed
+        for key in changed:
+            raw[key] = data[key]
+
+        if "fanlevel" in changed:
+            fan_level = raw["fanlevel"]
+            self.fan_level = fan_level if isinstance(fan_level, int) else 0
+            self.level_name = AEROPAC_FAN_LEVELS.get(self.fan_level, "Unknown")
+            # Map fan levels 1-7 to percentage 1-100
+            self.percentage = int((self.fan_level / 7) * 100) if self.fan_level else 0
+
+        # The device state of the parameters is the fresher source, it is
+        # what pushes carry
+        active = self.active
+        if "deviceactive" in changed:
+            active = bool(raw["deviceactive"])
+        if "devicestate" in changed and isinstance(raw["devicestate"], dict):
+            active = bool(raw["devicestate"].get("deviceactive", active))
+        if active != self.active:
+            self.active = active
+            changed.add("deviceactive")
+        self.is_on = self.active and self.fan_level > 0
+
+        if "timer" in changed:
+            self._parse_timer(raw["timer"])
+        if "warnings" in changed:
+            self.warnings = raw["warnings"] or []
+
+        return changed
+
+    def _parse_timer(self, timer: Any) -> None:
+        """Parse the timer parameters."""
+        self.timer_enabled = None
+        self.timer_minutes = None
+        self.timer_remaining = None
+        if not isinstance(timer, dict):
+            return
+
+        if "enabled" in timer:
+            self.timer_enabled = timer["enabled"]
+        remaining = timer.get("remainingtime")
+        if isinstance(remaining, dict) and "hour" in remaining and "minute" in remaining:
+            self.timer_minutes = remaining["hour"] * 60 + remaining["minute"]
+            self.timer_remaining = f"{remaining['hour']:02d}:{remaining['minute']:02d}"
\ No newline at end of file
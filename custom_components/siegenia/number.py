@@ -8,10 +8,10 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import AEROPAC_FAN_LEVELS, DOMAIN
+from .const import DOMAIN
 from .coordinator import SiegeniaDataUpdateCoordinator
+from .entity import SiegeniaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,19 +25,19 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
     # Only add number entity if we have device info
-    if coordinator.data and coordinator.data.get("device_info"):
+    if coordinator.data and coordinator.data.device_info:
         async_add_entities([SiegeniaFanLevelNumber(coordinator, entry)])
 
 
-class SiegeniaFanLevelNumber(CoordinatorEntity, NumberEntity):
+class SiegeniaFanLevelNumber(SiegeniaEntity, NumberEntity):
     """Representation of Siegenia fan level number entity."""
 
-    _attr_has_entity_name = True
     _attr_mode = NumberMode.SLIDER
     _attr_native_min_value = 0
     _attr_native_max_value = 7
     _attr_native_step = 1
     _attr_icon = "mdi:fan"
+    _watched_keys = frozenset({"fanlevel", "deviceactive"})
 
     def __init__(
         self,
@@ -45,25 +45,10 @@ class SiegeniaFanLevelNumber(CoordinatorEntity, NumberEntity):
         entry: ConfigEntry
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry)
         
-        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_fan_level"
         
-        # Set device info
-        device_info = coordinator.data.get("device_info", {})
-        device_name = device_info.get("devicename", "Siegenia Device")
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": device_name,
-            "manufacturer": "Siegenia",
-            "model": device_info.get("type", "Unknown"),
-            "sw_version": device_info.get("softwareversion"),
-            "hw_version": device_info.get("hardwareversion"),
-            "serial_number": device_info.get("serialnr"),
-        }
-        
         self._attr_name = "fanlevel"
         self._attr_translation_key = "fan_level"
 
@@ -72,7 +57,7 @@ class SiegeniaFanLevelNumber(CoordinatorEntity, NumberEntity):
         """Return the current fan level."""
         if not self.coordinator.data:
             return 0
-        return self.coordinator.data.get("fanlevel", 0)
+        return self.coordinator.data.fan_level
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the fan level."""
@@ -80,14 +65,11 @@ class SiegeniaFanLevelNumber(CoordinatorEntity, NumberEntity):
             fan_level = int(value)
             _LOGGER.debug("Setting fan level to %s", fan_level)
             
-            if fan_level == 0:
-                # Turn Device off
-                await self.coordinator.async_set_fan_level(0)
-                await self.coordinator.async_set_device_active(False)
-            else:
-                # Turn Device on, then set fan speed level
-                await self.coordinator.async_set_device_active(True)
-                await self.coordinator.async_set_fan_level(fan_level)
+            # Level 0 turns the device off, any other level turns it on;
+            # both go out as one write and only the last slider value is sent
+            await self.coordinator.async_set_state(
+                active=fan_level != 0, fan_level=fan_level
+            )
                 
         except Exception as err:
             _LOGGER.error("Error setting fan level: %s", err)
@@ -95,16 +77,13 @@ class SiegeniaFanLevelNumber(CoordinatorEntity, NumberEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if not self.coordinator.data:
+        state = self.coordinator.data
+        if not state:
             return {}
-            
-        attributes = {}
-        fan_level = self.coordinator.data.get("fanlevel", 0)
-        
-        # Name der aktuellen Stufe
-        attributes["level_name"] = AEROPAC_FAN_LEVELS.get(fan_level, "Unknown")
-        
-        # Gerätestatus
-        attributes["device_active"] = self.coordinator.data.get("deviceactive", False)
-        
-        return attributes
+
+        return {
+            # Name der aktuellen Stufe
+            "level_name": state.level_name,
+            # Gerätestatus
+            "device_active": state.active,
+        }
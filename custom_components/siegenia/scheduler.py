@@ -0,0 +1,133 @@
+"""Fleet-wide scheduling of Siegenia device operations."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULER, FLEET_MAX_CONCURRENT, FLEET_START_SPACING
+
+_LOGGER = logging.getLogger(__name__)
+
+# Kinds of operations that share a concurrency budget, all others have
+# their own
+_BUDGETS = {"reconnect": "connect"}
+
+
+@dataclass(slots=True)
+class OperationStats:
+    """Timing of one kind of scheduled operation."""
+
+    count: int = 0
+    failures: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    run_total: float = 0.0
+    run_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in seconds."""
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "wait_avg": self.wait_total / self.count if self.count else 0.0,
+            "wait_max": self.wait_max,
+            "run_avg": self.run_total / self.count if self.count else 0.0,
+            "run_max": self.run_max,
+        }
+
+
+class SiegeniaFleetScheduler:
+    """Stagger and bound device operations across all config entries.
+
+    Every connect, login and poll of every Siegenia device runs through
+    async_slot. Starts are spaced at least FLEET_START_SPACING apart, so a
+    Home Assistant restart ramps the fleet up instead of hitting all devices
+    at the same moment. Connects and polls each have their own budget of
+    FLEET_MAX_CONCURRENT operations at once, so units that are slow to
+    connect or unreachable cannot hold up polls of healthy devices. Because
+    coordinators schedule their next poll relative to the end of the
+    previous one, the stagger from startup carries over to polling.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = FLEET_MAX_CONCURRENT,
+        start_spacing: float = FLEET_START_SPACING,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._max_concurrent = max_concurrent
+        self._start_spacing = start_spacing
+        self._next_start = 0.0
+        self._queued = 0
+        self._running = 0
+        self._stats: dict[str, OperationStats] = {}
+
+    @asynccontextmanager
+    async def async_slot(self, kind: str) -> AsyncIterator[None]:
+        """Wait for a start slot, then run the operation inside the limit."""
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+
+        # Reserve the next start time before waiting so callers stay ordered
+        start_at = max(queued_at, self._next_start)
+        self._next_start = start_at + self._start_spacing
+
+        budget = _BUDGETS.get(kind, kind)
+        if (semaphore := self._semaphores.get(budget)) is None:
+            semaphore = self._semaphores[budget] = asyncio.Semaphore(
+                self._max_concurrent
+            )
+
+        self._queued += 1
+        try:
+            if start_at > queued_at:
+                await asyncio.sleep(start_at - queued_at)
+            await semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        stats = self._stats.setdefault(kind, OperationStats())
+        started_at = loop.time()
+        waited = started_at - queued_at
+        self._running += 1
+        try:
+            yield
+        except BaseException:
+            stats.failures += 1
+            raise
+        finally:
+            self._running -= 1
+            semaphore.release()
+            run = loop.time() - started_at
+            stats.count += 1
+            stats.wait_total += waited
+            stats.wait_max = max(stats.wait_max, waited)
+            stats.run_total += run
+            stats.run_max = max(stats.run_max, run)
+            if waited > 1:
+                _LOGGER.debug("%s waited %.1f s for a fleet slot", kind, waited)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return fleet-level timing of all operations."""
+        return {
+            "max_concurrent": self._max_concurrent,
+            "start_spacing": self._start_spacing,
+            "running": self._running,
+            "queued": self._queued,
+            "operations": {kind: stats.as_dict() for kind, stats in self._stats.items()},
+        }
+
+
+def async_get_scheduler(hass: HomeAssistant) -> SiegeniaFleetScheduler:
+    """Return the integration-wide scheduler, creating it on first use."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = SiegeniaFleetScheduler()
+    return scheduler
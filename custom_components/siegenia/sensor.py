@@ -0,0 +1,174 @@
+"""Diagnostic sensors for Siegenia devices."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import SiegeniaDataUpdateCoordinator
+from .device import SiegeniaDevice
+from .entity import SiegeniaEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+# The metrics change with every request, so read them on a fixed interval
+SCAN_INTERVAL = timedelta(seconds=60)
+PARALLEL_UPDATES = 0
+
+
+def _ms(value: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return round(value * 1000, 1) if value is not None else None
+
+
+def _last_push(device: SiegeniaDevice) -> datetime | None:
+    """Return the time of the last push."""
+    if device.metrics.last_push is None:
+        return None
+    return dt_util.utc_from_timestamp(device.metrics.last_push)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SiegeniaDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a Siegenia protocol diagnostic sensor."""
+
+    value_fn: Callable[[SiegeniaDevice], StateType | datetime]
+
+
+DIAGNOSTIC_SENSORS: tuple[SiegeniaDiagnosticSensorEntityDescription, ...] = (
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="round_trip_time",
+        name="Round-trip time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: _ms(device.rtt.srtt),
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="round_trip_jitter",
+        name="Round-trip jitter",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: _ms(device.rtt.rttvar),
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="request_timeouts",
+        name="Request timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.metrics.timeouts,
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="request_errors",
+        name="Request errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.metrics.errors,
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.metrics.reconnects,
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="push_rate",
+        name="Push rate",
+        native_unit_of_measurement="pushes/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: round(device.metrics.push_rate, 1),
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="pending_requests",
+        name="Pending requests",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: device.pending_requests,
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="queue_wait",
+        name="Queue wait (p99)",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda device: _ms(device.metrics.queue_wait.percentile(0.99)),
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="dropped_requests",
+        name="Dropped requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.metrics.dropped_requests,
+    ),
+    SiegeniaDiagnosticSensorEntityDescription(
+        key="last_push",
+        name="Last push",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_last_push,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Siegenia diagnostic sensors from a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Only add sensors if we have device info
+    if coordinator.data and coordinator.data.device_info:
+        async_add_entities(
+            SiegeniaDiagnosticSensor(coordinator, entry, description)
+            for description in DIAGNOSTIC_SENSORS
+        )
+
+
+class SiegeniaDiagnosticSensor(SiegeniaEntity, SensorEntity):
+    """Protocol diagnostic of a Siegenia device, disabled by default."""
+
+    entity_description: SiegeniaDiagnosticSensorEntityDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    # The metrics are not part of the coordinator data, so no pushed or
+    # written key concerns them; they are polled at SCAN_INTERVAL instead
+    _watched_keys = frozenset()
+
+    def __init__(
+        self,
+        coordinator: SiegeniaDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: SiegeniaDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll the metrics, which CoordinatorEntity would turn off."""
+        return True
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the current metric."""
+        return self.entity_description.value_fn(self.coordinator.device)
+
+    async def async_update(self) -> None:
+        """Read the metrics without refreshing the coordinator."""
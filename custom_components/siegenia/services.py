@@ -1,50 +1,151 @@
 """Services for Siegenia integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
+
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.service import async_extract_entity_ids
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, SERVICE_MAX_CONCURRENT
+from .coordinator import SiegeniaDataUpdateCoordinator
+from .index import async_get_index
+from .scheduler import async_get_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_SET_FAN_LEVEL = "set_fan_level"
+SERVICE_REFRESH_DEVICE_INFO = "refresh_device_info"
+SERVICE_GET_FLEET_STATS = "get_fleet_stats"
+SERVICE_GET_HISTORY = "get_history"
 
-SET_FAN_LEVEL_SCHEMA = vol.Schema(
+SET_FAN_LEVEL_SCHEMA = cv.make_entity_service_schema(
     {
-        vol.Required("entity_id"): cv.entity_ids,
         vol.Required("level"): vol.All(vol.Coerce(int), vol.Range(min=0, max=7)),
     }
 )
 
+REFRESH_DEVICE_INFO_SCHEMA = cv.make_entity_service_schema({})
+
+GET_HISTORY_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("since"): cv.datetime,
+        vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+
+def _async_target_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, SiegeniaDataUpdateCoordinator]:
+    """Return the coordinators of all devices targeted by a service call."""
+    selected = async_extract_referenced_entity_ids(hass, call)
+    return async_get_index(hass).async_resolve(
+        selected.referenced | selected.indirectly_referenced,
+        selected.referenced_devices,
+    )
+
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Siegenia integration."""
 
-    async def async_set_fan_level(call: ServiceCall) -> None:
-        """Service to set exact fan level."""
-        entity_ids = call.data["entity_id"]
+    async def async_set_fan_level(call: ServiceCall) -> ServiceResponse:
+        """Service to set exact fan level on every targeted device at once."""
         level = call.data["level"]
-        
-        for entity_id in entity_ids:
-            # Get the coordinator from the entity
-            entity = hass.data["entity_registry"].async_get(entity_id)
-            if not entity or entity.platform != DOMAIN:
-                continue
-                
-            # Find coordinator for this entity
-            for entry_id, coordinator in hass.data[DOMAIN].items():
-                if hasattr(coordinator, "async_set_fan_level"):
+        index = async_get_index(hass)
+        semaphore = asyncio.Semaphore(SERVICE_MAX_CONCURRENT)
+
+        async def async_set(coordinator: SiegeniaDataUpdateCoordinator) -> dict[str, Any]:
+            result: dict[str, Any] = {
+                "device_id": index.async_device_id(coordinator),
+                "name": coordinator.entry.title,
+                "success": True,
+            }
+            async with semaphore:
+                try:
                     await coordinator.async_set_fan_level(level)
-                    break
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.error(
+                        "Failed to set fan level of %s: %s", coordinator.entry.title, err
+                    )
+                    result["success"] = False
+                    result["error"] = str(err)
+            return result
+
+        coordinators = _async_target_coordinators(hass, call)
+        results = await asyncio.gather(
+            *(async_set(coordinator) for coordinator in coordinators.values())
+        )
+
+        if not call.return_response:
+            return None
+        return {"results": list(results)}
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_FAN_LEVEL,
         async_set_fan_level,
         schema=SET_FAN_LEVEL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_refresh_device_info(call: ServiceCall) -> None:
+        """Service to re-read the cached device information."""
+        coordinators = _async_target_coordinators(hass, call)
+        await asyncio.gather(
+            *(coordinator.async_refresh_device_info() for coordinator in coordinators.values())
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_DEVICE_INFO,
+        async_refresh_device_info,
+        schema=REFRESH_DEVICE_INFO_SCHEMA,
+    )
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Service to report the recent state changes of the targeted devices."""
+        since = call.data.get("since")
+        if since is not None:
+            since = dt_util.as_utc(since).timestamp()
+        index = async_get_index(hass)
+
+        return {
+            "devices": [
+                {
+                    "device_id": index.async_device_id(coordinator),
+                    "name": coordinator.entry.title,
+                    "history": coordinator.history.query(since, call.data.get("limit")),
+                }
+                for coordinator in _async_target_coordinators(hass, call).values()
+            ]
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_get_fleet_stats(call: ServiceCall) -> ServiceResponse:
+        """Service to report fleet-wide connect and poll timing."""
+        return async_get_scheduler(hass).stats
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FLEET_STATS,
+        async_get_fleet_stats,
+        supports_response=SupportsResponse.ONLY,
     )
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""Persistent storage for the Siegenia integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_SNAPSHOTS,
+    DATA_TOKENS,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY_TOKENS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from .model import SiegeniaState
+
+
+class SiegeniaTokenStore:
+    """Long-life session tokens of all devices, keyed by config entry."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the token store."""
+        self._store: Store[dict[str, str]] = Store(hass, STORAGE_VERSION, STORAGE_KEY_TOKENS)
+        self._tokens: dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored tokens."""
+        self._tokens = await self._store.async_load() or {}
+
+    @callback
+    def get(self, entry_id: str) -> str | None:
+        """Return the token of a config entry."""
+        return self._tokens.get(entry_id)
+
+    @callback
+    def async_set(self, entry_id: str, token: str | None) -> None:
+        """Store or forget the token of a config entry."""
+        if token is None:
+            if self._tokens.pop(entry_id, None) is None:
+                return
+        elif self._tokens.get(entry_id) == token:
+            return
+        else:
+            self._tokens[entry_id] = token
+        self._store.async_delay_save(lambda: self._tokens, STORAGE_SAVE_DELAY)
+
+
+class SiegeniaSnapshotStore:
+    """Last known device information and state of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry_id}"
+        )
+        self._state: SiegeniaState | None = None
+        self._pending = False
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the stored snapshot, None if there is none yet."""
+        return await self._store.async_load()
+
+    @callback
+    def async_schedule_save(self, state: SiegeniaState) -> None:
+        """Save the state soon; repeated calls within the delay are merged.
+
+        The state is only serialized when the delayed save runs.
+        """
+        self._state = state
+        self._pending = True
+        self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data to save."""
+        self._pending = False
+        return self._state.as_dict() if self._state else {}
+
+    async def async_flush(self) -> None:
+        """Write a scheduled save right away."""
+        if self._pending:
+            await self._store.async_save(self._snapshot())
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot, cancelling a scheduled save."""
+        self._pending = False
+        await self._store.async_remove()
+
+
+@callback
+def async_get_snapshot_store(hass: HomeAssistant, entry_id: str) -> SiegeniaSnapshotStore:
+    """Return the snapshot store of a config entry, creating it on first use.
+
+    Reloads and removal of the entry share the instance, so a save it
+    scheduled cannot write the snapshot back after it was deleted.
+    """
+    stores: dict[str, SiegeniaSnapshotStore] = hass.data.setdefault(DATA_SNAPSHOTS, {})
+    if (store := stores.get(entry_id)) is None:
+        store = stores[entry_id] = SiegeniaSnapshotStore(hass, entry_id)
+    return store
+
+
+async def async_get_token_store(hass: HomeAssistant) -> SiegeniaTokenStore:
+    """Return the integration-wide token store, loading it on first use."""
+    if (store := hass.data.get(DATA_TOKENS)) is None:
+        store = SiegeniaTokenStore(hass)
+        await store.async_load()
+        hass.data[DATA_TOKENS] = store
+    return store
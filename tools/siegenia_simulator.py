@@ -0,0 +1,405 @@
+"""Local stand-in for Siegenia devices speaking the WebSocket protocol.
+
+Runs one or more simulated AEROPAC controllers so SiegeniaDevice and the
+coordinator can be exercised without real hardware. Each simulated device
+listens on its own port at ``/WebSocket`` over ws or wss (self-signed
+certificate) and answers ``login``, ``getDevice``, ``getDeviceParams``,
+``getDeviceState``, ``setDeviceParams`` and ``keepAlive``. It can also send
+unsolicited ``deviceParams`` pushes and inject latency, lost responses and
+dropped connections.
+
+Example:
+    python tools/siegenia_simulator.py --devices 50 --base-port 9000 \\
+        --ssl --latency 0.02 --jitter 0.01 --push-rate 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+import random
+import secrets
+import ssl
+import subprocess
+import tempfile
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour shared by all simulated devices."""
+
+    username: str = "admin"
+    password: str = "0000"
+    # Response delay in seconds: latency +/- uniform jitter
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Probability that a response is silently dropped
+    loss: float = 0.0
+    # Probability that the device closes the socket after a request
+    disconnect_rate: float = 0.0
+    # Unsolicited deviceParams pushes per second per connection, 0 = off
+    push_rate: float = 0.0
+    # Serve requests one at a time like the embedded web server does
+    serial: bool = True
+
+
+@dataclass
+class SimulatedDevice:
+    """State and protocol handling of one simulated controller."""
+
+    index: int
+    port: int
+    config: SimulatorConfig
+    info: dict[str, Any] = field(default_factory=dict)
+    fanlevel: int = 0
+    deviceactive: bool = False
+    timer_enabled: bool = False
+    timer_minutes: int = 0
+    warnings: list[str] = field(default_factory=list)
+    tokens: set[str] = field(default_factory=set)
+    connections: set[web.WebSocketResponse] = field(default_factory=set)
+    requests_served: int = 0
+    pushes_sent: int = 0
+
+    def __post_init__(self) -> None:
+        """Fill in the device information."""
+        if not self.info:
+            self.info = {
+                "devicename": f"AEROPAC Sim {self.index}",
+                "type": 1,
+                "serialnr": f"SIM{self.index:06d}",
+                "softwareversion": "1.6.3",
+                "hardwareversion": "2.0",
+                "devicelocation": "Simulator",
+            }
+
+    def params(self) -> dict[str, Any]:
+        """Return the getDeviceParams payload."""
+        return {
+            "fanlevel": self.fanlevel,
+            "devicestate": {"deviceactive": self.deviceactive},
+            "timer": {
+                "enabled": self.timer_enabled,
+                "remainingtime": {
+                    "hour": self.timer_minutes // 60,
+                    "minute": self.timer_minutes % 60,
+                },
+            },
+        }
+
+    def state(self) -> dict[str, Any]:
+        """Return the getDeviceState payload."""
+        return {
+            "deviceactive": self.deviceactive,
+            "warnings": list(self.warnings),
+        }
+
+    def apply_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Apply setDeviceParams and return the push describing the change."""
+        changed: dict[str, Any] = {}
+        if "fanlevel" in params:
+            level = int(params["fanlevel"])
+            if not 0 <= level <= 7:
+                raise ValueError(f"invalid fanlevel {level}")
+            self.fanlevel = level
+            changed["fanlevel"] = level
+        if "deviceactive" in params.get("devicestate", {}):
+            self.deviceactive = bool(params["devicestate"]["deviceactive"])
+            changed["deviceactive"] = self.deviceactive
+            changed["devicestate"] = {"deviceactive": self.deviceactive}
+        if "timer" in params:
+            timer = params["timer"]
+            self.timer_enabled = bool(timer.get("enabled", self.timer_enabled))
+            if "remainingtime" in timer:
+                remaining = timer["remainingtime"]
+                self.timer_minutes = remaining.get("hour", 0) * 60 + remaining.get(
+                    "minute", 0
+                )
+            changed["timer"] = self.params()["timer"]
+        return changed
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the response to a request, None if it should be ignored."""
+        command = request.get("command")
+        response: dict[str, Any] = {"id": request.get("id"), "status": "ok"}
+
+        if command == "login":
+            if "token" in request and request["token"] in self.tokens:
+                response["data"] = {"token": request["token"]}
+            elif (
+                request.get("user") == self.config.username
+                and request.get("password") == self.config.password
+            ):
+                token = secrets.token_hex(16)
+                self.tokens.add(token)
+                response["data"] = {"token": token}
+            else:
+                response["status"] = "not_authorized"
+        elif command == "getDevice":
+            response["data"] = dict(self.info)
+        elif command == "getDeviceParams":
+            response["data"] = self.params()
+        elif command == "getDeviceState":
+            response["data"] = self.state()
+        elif command == "setDeviceParams":
+            try:
+                response["push"] = self.apply_params(request.get("params", {}))
+            except (TypeError, ValueError):
+                response["status"] = "error"
+        elif command == "keepAlive":
+            pass
+        else:
+            response["status"] = "unknown_command"
+
+        self.requests_served += 1
+        return response
+
+    def random_push(self) -> dict[str, Any]:
+        """Change some state like a device ramping its fan."""
+        if self.timer_enabled and self.timer_minutes:
+            self.timer_minutes -= 1
+            return {"timer": self.params()["timer"]}
+        self.fanlevel = random.randint(1, 7)
+        return {"fanlevel": self.fanlevel}
+
+    async def websocket_handler(self, request: web.Request) -> web.WebSocketResponse:
+        """Serve one client connection."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections.add(ws)
+        lock = asyncio.Lock()
+        pusher = (
+            asyncio.create_task(self._push_loop(ws))
+            if self.config.push_rate > 0
+            else None
+        )
+        tasks: set[asyncio.Task] = set()
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    data = json.loads(msg.data)
+                except ValueError:
+                    continue
+                task = asyncio.create_task(self._respond(ws, lock, data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            if pusher:
+                pusher.cancel()
+            for task in tasks:
+                task.cancel()
+            self.connections.discard(ws)
+        return ws
+
+    async def _respond(
+        self, ws: web.WebSocketResponse, lock: asyncio.Lock, request: dict[str, Any]
+    ) -> None:
+        """Answer a request with the configured latency and faults."""
+        config = self.config
+        if config.serial:
+            await lock.acquire()
+        try:
+            delay = config.latency + random.uniform(-config.jitter, config.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            response = self.handle(request)
+        finally:
+            if config.serial:
+                lock.release()
+
+        if ws.closed or response is None:
+            return
+        if config.loss and random.random() < config.loss:
+            return
+
+        push = response.pop("push", None)
+        await ws.send_str(json.dumps(response))
+        if push:
+            await self.push(push)
+
+        if config.disconnect_rate and random.random() < config.disconnect_rate:
+            await ws.close()
+
+    async def push(self, data: dict[str, Any]) -> None:
+        """Send an unsolicited deviceParams push to every client."""
+        payload = json.dumps({"command": "deviceParams", "data": data})
+        for ws in list(self.connections):
+            if not ws.closed:
+                await ws.send_str(payload)
+                self.pushes_sent += 1
+
+    async def _push_loop(self, ws: web.WebSocketResponse) -> None:
+        """Send random pushes at the configured average rate."""
+        while not ws.closed:
+            await asyncio.sleep(random.expovariate(self.config.push_rate))
+            if not ws.closed:
+                await ws.send_str(
+                    json.dumps({"command": "deviceParams", "data": self.random_push()})
+                )
+                self.pushes_sent += 1
+
+    async def drop_connections(self) -> None:
+        """Close every client connection, as after a Wi-Fi blip."""
+        for ws in list(self.connections):
+            await ws.close()
+
+
+def create_self_signed_context(directory: str) -> ssl.SSLContext:
+    """Create a server SSL context with a throwaway self-signed certificate."""
+    certfile = os.path.join(directory, "cert.pem")
+    keyfile = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", keyfile, "-out", certfile, "-days", "1",
+            "-subj", "/CN=siegenia-simulator",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return load_ssl_context(certfile, keyfile)
+
+
+def load_ssl_context(certfile: str, keyfile: str) -> ssl.SSLContext:
+    """Create a server SSL context from certificate files."""
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+class SimulatorFleet:
+    """A set of simulated devices served from consecutive ports."""
+
+    def __init__(
+        self,
+        count: int = 1,
+        base_port: int = 9000,
+        host: str = "127.0.0.1",
+        config: SimulatorConfig | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """Initialize the fleet."""
+        self.host = host
+        self.config = config or SimulatorConfig()
+        self.ssl_context = ssl_context
+        self.devices = [
+            SimulatedDevice(index, base_port + index, self.config)
+            for index in range(count)
+        ]
+        self._runners: list[web.AppRunner] = []
+
+    @property
+    def use_ssl(self) -> bool:
+        """Return True if the devices serve wss."""
+        return self.ssl_context is not None
+
+    async def start(self) -> None:
+        """Start serving all devices."""
+        for device in self.devices:
+            app = web.Application()
+            app.router.add_get("/WebSocket", device.websocket_handler)
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(
+                runner, self.host, device.port, ssl_context=self.ssl_context
+            )
+            await site.start()
+            self._runners.append(runner)
+        _LOGGER.info(
+            "Serving %d simulated device(s) on %s:%d-%d (%s)",
+            len(self.devices),
+            self.host,
+            self.devices[0].port,
+            self.devices[-1].port,
+            "wss" if self.use_ssl else "ws",
+        )
+
+    async def stop(self) -> None:
+        """Stop all devices."""
+        for device in self.devices:
+            await device.drop_connections()
+        for runner in self._runners:
+            await runner.cleanup()
+        self._runners.clear()
+
+    async def __aenter__(self) -> SimulatorFleet:
+        """Start the fleet as an async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop the fleet."""
+        await self.stop()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run the simulator until interrupted."""
+    config = SimulatorConfig(
+        username=args.username,
+        password=args.password,
+        latency=args.latency,
+        jitter=args.jitter,
+        loss=args.loss,
+        disconnect_rate=args.disconnect_rate,
+        push_rate=args.push_rate,
+        serial=not args.concurrent,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        ssl_context = None
+        if args.certfile and args.keyfile:
+            ssl_context = load_ssl_context(args.certfile, args.keyfile)
+        elif args.ssl:
+            ssl_context = create_self_signed_context(directory)
+
+        fleet = SimulatorFleet(args.devices, args.base_port, args.host, config, ssl_context)
+        async with fleet:
+            while True:
+                await asyncio.sleep(args.drop_interval or 3600)
+                if args.drop_interval:
+                    device = random.choice(fleet.devices)
+                    _LOGGER.info("Dropping connections of device %d", device.index)
+                    await device.drop_connections()
+
+
+def main() -> None:
+    """Parse arguments and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--devices", type=int, default=1, help="number of devices")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=9000)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="0000")
+    parser.add_argument("--ssl", action="store_true", help="serve wss with a self-signed certificate")
+    parser.add_argument("--certfile", help="certificate for wss instead of a generated one")
+    parser.add_argument("--keyfile", help="private key for --certfile")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- random delay in seconds")
+    parser.add_argument("--loss", type=float, default=0.0, help="probability of dropping a response")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="probability of closing after a request")
+    parser.add_argument("--drop-interval", type=float, default=0.0, help="seconds between forced disconnects of a random device")
+    parser.add_argument("--push-rate", type=float, default=0.0, help="pushes per second per connection")
+    parser.add_argument("--concurrent", action="store_true", help="answer requests concurrently instead of one at a time")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()